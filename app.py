@@ -5,34 +5,47 @@ Handles web routes, data processing for lot calculations, and file exports.
 """
 
 # Standard library imports
+import collections
+import concurrent.futures
+import functools
+import hashlib
 import io
 import json
 import math
 import os
 import re
+import shutil
 import sys # Added for print to stderr
 import tempfile
+import threading
+import time
+import unicodedata
+from urllib.parse import quote
 import zipfile
+import zlib
+from xml.sax.saxutils import XMLGenerator
 
 # Third-party imports
-import ezdxf
-from ezdxf.enums import TextEntityAlignment
-from flask import Flask, current_app, jsonify, render_template, request, send_file
+from flask import Flask, Response, current_app, jsonify, render_template, request, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_caching import Cache
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-import geopandas as gpd
+import numpy as np
+import orjson
 import pandas as pd
-from pyproj import CRS, Transformer # CRS, Transformer were already here
-from pyproj.exceptions import CRSError # CRSError was already here
-from shapely.geometry import Point, LineString, Polygon
-import simplekml
+import shapely
+from shapely.geometry import Point
+# Export-only libraries (geopandas, ezdxf) are imported inside the
+# export routes and handlers that use them, keeping worker start-up light.
 
 # Local application imports
-from gis_utils import DEFAULT_TARGET_CRS_EPSG, get_transformers
+from gis_utils import (
+    DEFAULT_TARGET_CRS_EPSG, IdentityTransformer, get_transformer_to_latlon,
+    get_transformer_to_projected, get_transformers
+)
 from utils import (
     calculate_azimuth,
-    calculate_new_coordinates,
     get_sanitized_filename_base,
     parse_survey_line_to_bearing_distance,
     decimal_azimuth_to_bearing_string
@@ -41,7 +54,29 @@ from utils import (
 # Area Conversion Constants
 SQM_TO_HECTARES = 0.0001
 
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson.
+
+    Serializes the large per-lot coordinate lists returned by the API (and
+    parses request bodies) in C. NumPy arrays and scalars are serialized
+    directly; other types orjson does not handle fall back to Flask's default
+    conversions (dates, decimals, UUIDs, dataclasses).
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # SECRET_KEY Handling
 fallback_secret_key = 'your_very_secret_key_rizal_encoder_v13_csv_cache'
@@ -65,12 +100,21 @@ else:
     else:
         print(warning_message, file=sys.stderr)
 
+# RATELIMIT_STORAGE_URI Handling
+# In-memory storage keeps separate counters in every worker process; point this
+# at a shared backend (e.g. "redis://host:6379") to enforce the limits across
+# all gunicorn workers.
+ratelimit_storage_uri = os.environ.get('RATELIMIT_STORAGE_URI') or "memory://"
+
 limiter = Limiter(
     get_remote_address,  # Key by remote IP address
     app=app,
     default_limits=["200 per day", "50 per hour"],  # Default for routes
-    storage_uri="memory://",  # Use in-memory storage
-    # strategy="fixed-window"  # Default, can also be "moving-window", etc.
+    storage_uri=ratelimit_storage_uri,
+    # Fixed window is the cheapest strategy: one counter increment per limit
+    # per request. "moving-window" keeps a timestamp per hit and scans them on
+    # every check, which is wasted work for these coarse abuse limits.
+    strategy="fixed-window",
 )
 
 # Application configuration
@@ -115,29 +159,185 @@ cache = Cache(app)
 
 # Path to the reference points CSV file
 RIZAL_CSV_PATH = os.path.join(app.root_path, 'rizal.csv')
+# Cleaned reference points persisted next to the CSV so a process restart can
+# skip parsing and cleaning; regenerated whenever the CSV's signature changes.
+RIZAL_CLEANED_CACHE_PATH = os.path.join(app.root_path, 'rizal.cleaned.json')
 
 # DEFAULT_TARGET_CRS_EPSG is imported from gis_utils
-# CRS_LATLON_EPSG (4326) is defined in gis_utils and used by get_transformers
+# CRS_LATLON_EPSG (4326) is defined in gis_utils and used by the transformer getters
 # _transformer_cache is defined and managed within gis_utils
 
 
-@cache.cached(timeout=86400)  # Cache for 24 hours
+def _reference_points_csv_signature():
+    """
+    Identifies the current version of the reference points CSV.
+
+    Returns:
+        list: [mtime_ns, size] of RIZAL_CSV_PATH (a list so it compares equal
+              after a JSON round trip).
+
+    Raises:
+        OSError: If the CSV cannot be stat()ed (e.g. it does not exist).
+    """
+    csv_stat = os.stat(RIZAL_CSV_PATH)
+    return [csv_stat.st_mtime_ns, csv_stat.st_size]
+
+
+def _reference_points_version():
+    """
+    Returns the version of the reference data, for keying anything derived
+    from a reference point looked up by name.
+
+    Returns:
+        tuple or None: The CSV's (mtime_ns, size), or None if it cannot be
+                       stat()ed.
+    """
+    try:
+        return tuple(_reference_points_csv_signature())
+    except OSError:
+        return None
+
+
+def _read_cleaned_reference_points(csv_signature):
+    """
+    Reads the persisted cleaned reference points, if they are still current.
+
+    The sidecar file records the signature of the CSV it was built from and
+    is only trusted when that matches the CSV exactly. Comparing file times
+    alone would keep a stale sidecar when the CSV is replaced by a file with
+    an older timestamp (e.g. restored from a backup or copied with cp -p).
+
+    Args:
+        csv_signature (list): Current _reference_points_csv_signature().
+
+    Returns:
+        list or None: The cleaned reference point records, or None if the
+                      sidecar is missing, stale, or unreadable.
+    """
+    try:
+        with open(RIZAL_CLEANED_CACHE_PATH, 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        current_app.logger.warning(
+            f"Ignoring unreadable cleaned reference points file "
+            f"'{os.path.basename(RIZAL_CLEANED_CACHE_PATH)}': {str(e)}"
+        )
+        return None
+    # Files from before the signature was recorded hold a bare list: stale
+    if not isinstance(sidecar, dict) or sidecar.get('source') != csv_signature:
+        return None
+    records = sidecar.get('records')
+    if not isinstance(records, list) or not records:
+        return None
+    return records
+
+
+def _write_cleaned_reference_points(records, csv_signature):
+    """
+    Persists cleaned reference point records next to the source CSV.
+
+    Written to a temporary file first and moved into place so concurrent
+    workers never read a partially written file. Failures (e.g. a read-only
+    deployment directory) are logged and otherwise ignored.
+
+    Args:
+        records (list): Reference point dictionaries as returned by
+                        load_reference_points().
+        csv_signature (list): _reference_points_csv_signature() of the CSV
+                              the records were read from.
+    """
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(RIZAL_CLEANED_CACHE_PATH), suffix='.tmp'
+        )
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'source': csv_signature, 'records': records}, f)
+        os.replace(tmp_path, RIZAL_CLEANED_CACHE_PATH)
+        tmp_path = None
+    except OSError as e:
+        current_app.logger.warning(
+            f"Could not persist cleaned reference points to "
+            f"'{os.path.basename(RIZAL_CLEANED_CACHE_PATH)}': {str(e)}"
+        )
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _index_reference_points(records):
+    """
+    Indexes reference point records by their display name.
+
+    Args:
+        records (list): Reference point dictionaries with a 'display_name'.
+
+    Returns:
+        dict: Mapping of 'display_name' to its reference point dictionary.
+    """
+    return {record['display_name']: record for record in records}
+
+
+# In-process cache of load_reference_points() results, valid for as long as
+# the CSV's version (_reference_points_version()) is unchanged. Module-level
+# (rather than Flask-Caching) so a hit is a stat() and a dict read, with no
+# pickling.
+_reference_points_cache = {'entry': None}  # 'entry' is (csv_version, result)
+_reference_points_cache_lock = threading.Lock()
+
+
 def load_reference_points():
     """
     Loads and processes reference points from the Rizal CSV file.
 
-    The result is cached for 24 hours to minimize disk I/O and processing.
+    The result is kept in memory until the CSV's version changes (its
+    modification time and size, the same version the sidecar file and the
+    export parameter cache are keyed on), so repeated calls cost one stat()
+    of the file. The records are shared
+    between callers and must not be modified. The cleaned records are also
+    persisted to RIZAL_CLEANED_CACHE_PATH so that a restarted process can skip
+    the CSV cleaning pipeline while the CSV is unchanged.
+
+    Returns:
+        tuple: Same as _load_reference_points_uncached().
+    """
+    csv_version = _reference_points_version()
+    if csv_version is None:
+        return _load_reference_points_uncached()  # Reports the missing file
+
+    entry = _reference_points_cache['entry']
+    if entry is not None and entry[0] == csv_version:
+        return entry[1]
+    with _reference_points_cache_lock:
+        # Another thread may have reloaded while this one waited for the lock
+        entry = _reference_points_cache['entry']
+        if entry is None or entry[0] != csv_version:
+            entry = (csv_version, _load_reference_points_uncached())
+            _reference_points_cache['entry'] = entry
+        return entry[1]
+
+
+def _load_reference_points_uncached():
+    """
+    Reads and cleans the reference points (see load_reference_points()).
 
     Returns:
         tuple: A tuple containing:
             - list: A list of reference point dictionaries, each with
                     'display_name', 'EASTINGS', and 'NORTHINGS'. Empty if error.
+            - dict: The same dictionaries keyed by 'display_name', for
+                    constant-time lookup of a selected point. Empty if error.
             - str or None: An error message string if an error occurred,
                            otherwise None.
     """
     current_app.logger.info(
         f"Executing load_reference_points() from {RIZAL_CSV_PATH} "
-        f"(cache miss or timeout)"
+        f"(cache miss or CSV changed)"
     )
     
     location_col = 'LOCATION'
@@ -155,18 +355,31 @@ def load_reference_points():
     }
 
     try:
-        if not os.path.exists(RIZAL_CSV_PATH):
+        try:
+            # Taken before reading: if the CSV is replaced mid-load, the
+            # sidecar records the old signature and is rebuilt next time.
+            csv_signature = _reference_points_csv_signature()
+        except FileNotFoundError:
             user_msg = (
                 f"Error: The reference points file ('{os.path.basename(RIZAL_CSV_PATH)}') "
                 f"could not be found on the server. Please contact support."
             )
             current_app.logger.error(f"Reference points file not found: {RIZAL_CSV_PATH}")
-            return [], user_msg
+            return [], {}, user_msg
+
+        cleaned_records = _read_cleaned_reference_points(csv_signature)
+        if cleaned_records is not None:
+            current_app.logger.info(
+                f"Loaded {len(cleaned_records)} cleaned reference points from "
+                f"'{os.path.basename(RIZAL_CLEANED_CACHE_PATH)}'"
+            )
+            return cleaned_records, _index_reference_points(cleaned_records), None
         
         df = pd.read_csv(
             RIZAL_CSV_PATH, 
             encoding='utf-8-sig', 
             on_bad_lines='warn',
+            usecols=lambda col: col in required_csv_cols, # Skip unused columns while parsing
             dtype=csv_dtypes # Use defined dtypes
         )
         
@@ -180,25 +393,14 @@ def load_reference_points():
             current_app.logger.error(
                 f"CSV missing columns in '{os.path.basename(RIZAL_CSV_PATH)}': {missing_cols_str}"
             )
-            return [], user_msg
-
-        # Select only required columns to minimize memory and processing
-        df = df[list(required_csv_cols)].copy()
+            return [], {}, user_msg
 
-        # Initial dropna based on essential string columns before stripping
-        # Convert to string and strip for all specified required columns first to handle mixed types robustly
-        for col in required_csv_cols:
-             df[col] = df[col].astype(str).str.strip()
-
-        # Now drop rows if any of the required columns became empty strings after stripping or were NaN initially
-        df.dropna(subset=list(required_csv_cols), inplace=True)
-        df = df[~df[location_col].isin(['', '#REF!'])]
-        df = df[~df[point_col].isin(['', '#REF!'])]
-        # Eastings and Northings will be validated for numeric content later
-
-        # Filter out empty strings again after specific value filtering, for all required columns
-        for col in required_csv_cols:
-            df = df[df[col].str.len() > 0]
+        # Strip all required columns in one pass (NaN stays NaN), then drop rows
+        # where any of them is missing, blank or a spreadsheet '#REF!' error.
+        # Eastings and Northings are validated for numeric content later.
+        df = df.apply(lambda col: col.str.strip())
+        df.dropna(inplace=True)
+        df = df[~df.isin(['', '#REF!']).any(axis=1)]
 
         if df.empty:
             user_msg = (
@@ -210,7 +412,7 @@ def load_reference_points():
                 f"No valid data rows in '{os.path.basename(RIZAL_CSV_PATH)}' "
                 f"after initial cleaning and filtering."
             )
-            return [], user_msg
+            return [], {}, user_msg
 
         # Clean and convert coordinate columns
         # Remove commas and then convert to numeric, coercing errors
@@ -233,15 +435,19 @@ def load_reference_points():
                 f"No valid numeric coordinates in '{os.path.basename(RIZAL_CSV_PATH)}' "
                 f"after conversion attempt."
             )
-            return [], user_msg
+            return [], {}, user_msg
 
         df['display_name'] = df[location_col] + " - " + df[point_col]
         df.drop_duplicates(subset=['display_name'], keep='first', inplace=True)
         df.sort_values(by='display_name', inplace=True)
         
-        # Ensure EASTINGS and NORTHINGS are float in the final output, not string.
-        # They were converted to numeric by pd.to_numeric earlier.
-        return df[['display_name', easting_col, northing_col]].to_dict('records'), None
+        # Ensure EASTINGS and NORTHINGS are plain floats in the final output, so
+        # callers can use them directly without converting per request.
+        records = df[['display_name', easting_col, northing_col]].astype(
+            {easting_col: 'float64', northing_col: 'float64'}
+        ).to_dict('records')
+        _write_cleaned_reference_points(records, csv_signature)
+        return records, _index_reference_points(records), None
     
     except pd.errors.EmptyDataError:
         user_msg = (
@@ -251,7 +457,7 @@ def load_reference_points():
         current_app.logger.error(
             f"Pandas EmptyDataError for '{os.path.basename(RIZAL_CSV_PATH)}': File is empty."
         )
-        return [], user_msg
+        return [], {}, user_msg
     except Exception as e:
         user_msg = (
             f"A critical server error occurred while processing the reference "
@@ -262,246 +468,506 @@ def load_reference_points():
             f"Critical error processing '{os.path.basename(RIZAL_CSV_PATH)}': {str(e)}",
             exc_info=True
         )
-        return [], user_msg
+        return [], {}, user_msg
 
 
-# --- Helper functions for _calculate_single_lot_geometry ---
+# --- Helper functions for _calculate_lots_geometry ---
 
-def _parse_and_calculate_next_point(
-        line_str, current_e, current_n, line_num_for_log,
-        lot_name_for_log, line_description_for_log
-    ):
+# Very large lat/lon transforms are split across a small thread pool. PROJ
+# releases the GIL while transforming, so the chunks run in parallel; lot
+# parsing and result assembly are pure Python and gain nothing from threads,
+# so they stay serial. No pool is created on single-CPU hosts.
+PARALLEL_TRANSFORM_MIN_POINTS = 50000
+_TRANSFORM_WORKERS = min(4, os.cpu_count() or 1)
+_transform_executor = (
+    concurrent.futures.ThreadPoolExecutor(
+        max_workers=_TRANSFORM_WORKERS, thread_name_prefix="latlon-transform"
+    )
+    if _TRANSFORM_WORKERS > 1 else None
+)
+
+# Pre-compiled regular expression splitting survey text into lines. Runs of
+# line boundaries collapse into one split, so blank lines produce no entries.
+# Uses the same boundary characters as str.splitlines().
+SURVEY_LINE_SPLIT_REGEX = re.compile('[\r\n\v\f\x1c\x1d\x1e\x85\u2028\u2029]+')
+# A whole survey line in its plain form ("N 45D 30' E;120.5"), matched per
+# line of the "\n"-joined lot text: (ns, deg, min, ew, distance). Deliberately
+# ASCII-only and stricter than parse_survey_line_to_bearing_distance, whose
+# per-line checks remain the reference for anything this does not match.
+SURVEY_LINE_FAST_REGEX = re.compile(
+    r"^[^\S\n]*([NSns])[^\S\n]+(\d{1,2})[Dd][^\S\n]+(\d{1,2})[′'’][^\S\n]+([EWew])"
+    r"[^\S\n]*;[^\S\n]*(\d+(?:\.\d*)?|\.\d+)[^\S\n]*$",
+    re.MULTILINE | re.ASCII
+)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_lot_lines(survey_lines_text_for_lot):
     """
-    Parses a survey line, calculates azimuth, and computes new coordinates.
+    Parses and validates every survey line of a lot up front.
+
+    All lines are checked before any geometry is computed, so the traverse
+    walk runs straight through on clean arrays. The result is memoized on the
+    raw lines text, so lots that are resubmitted unchanged (e.g., while
+    another lot is being edited) skip the bearing parsing and azimuth work
+    entirely; the returned arrays are read-only because they are shared
+    between calls.
 
     Args:
-        line_str (str): The survey line string.
-        current_e (float): Current Easting.
-        current_n (float): Current Northing.
-        line_num_for_log (int): Line number for logging purposes.
-        lot_name_for_log (str): Lot name for logging.
-        line_description_for_log (str): Description of the line type for logging.
+        survey_lines_text_for_lot (str): Multiline string of survey lines.
 
     Returns:
-        dict: A dictionary with 'status', 'e', 'n', 'line_data' on success,
-              or 'status', 'message' on error.
+        tuple: A tuple (azimuths, distances, error). 'azimuths' and
+               'distances' are float64 arrays with one entry per non-blank
+               line, or None if a line is invalid. 'error' is None on
+               success, or a tuple (line_num, line_str, reason) describing
+               the first bad line.
     """
-    # current_app is now imported at module level
-    line_data = parse_survey_line_to_bearing_distance(line_str)
-    if not line_data:
-        return {
-            "status": "error",
-            "message": f"Lot '{lot_name_for_log}': Invalid {line_description_for_log} (line {line_num_for_log}): {line_str}"
-        }
-    
-    azimuth = calculate_azimuth(line_data)
-    if azimuth is None:
-        return {
-            "status": "error",
-            "message": f"Lot '{lot_name_for_log}': Azimuth error {line_description_for_log} (line {line_num_for_log}): {line_str}"
-        }
+    survey_lines = [
+        line for line in SURVEY_LINE_SPLIT_REGEX.split(survey_lines_text_for_lot)
+        if line and not line.isspace()
+    ]
+
+    # Fast path: one regex pass over the whole lot, azimuths in NumPy. Only
+    # taken when every line is in the plain format and within range; anything
+    # else goes through the per-line parser below, which reports the error.
+    fields = SURVEY_LINE_FAST_REGEX.findall("\n".join(survey_lines))
+    if len(fields) == len(survey_lines):
+        ns_chars, deg_strs, min_strs, ew_chars, dist_strs = zip(*fields) if fields else ((),) * 5
+        degs = np.array(deg_strs, dtype=np.int64)
+        mins = np.array(min_strs, dtype=np.int64)
+        distances = np.array(list(map(float, dist_strs)), dtype=np.float64)
+        if (degs <= 89).all() and (mins <= 59).all() and (distances > 0).all():
+            dec_degs = degs + mins / 60.0
+            is_north = np.array([c in "Nn" for c in ns_chars], dtype=bool)
+            is_east = np.array([c in "Ee" for c in ew_chars], dtype=bool)
+            azimuths = np.where(
+                is_north,
+                np.where(is_east, dec_degs, 360.0 - dec_degs),
+                np.where(is_east, 180.0 - dec_degs, 180.0 + dec_degs)
+            )
+            azimuths.flags.writeable = False
+            distances.flags.writeable = False
+            return azimuths, distances, None
+
+    azimuths = []
+    distances = []
+    for line_num, line_str in enumerate(survey_lines, start=1):
+        line_data = parse_survey_line_to_bearing_distance(line_str)
+        if not line_data:
+            return None, None, (line_num, line_str, "Invalid")
+
+        azimuth = calculate_azimuth(line_data)
+        if azimuth is None:
+            return None, None, (line_num, line_str, "Azimuth error")
+
+        azimuths.append(azimuth)
+        distances.append(line_data['distance'])
+
+    azimuths = np.array(azimuths, dtype=np.float64)
+    distances = np.array(distances, dtype=np.float64)
+    azimuths.flags.writeable = False
+    distances.flags.writeable = False
+    return azimuths, distances, None
 
-    next_e, next_n = calculate_new_coordinates(current_e, current_n, azimuth, line_data['distance'])
-    return {"status": "success", "e": next_e, "n": next_n, "line_data": line_data}
 
-def _transform_point_to_latlon(e, n, transformer_to_latlon, point_desc_for_log, lot_name_for_log):
+def _transform_points_to_latlon(es, ns, transformer_to_latlon, label_for_log):
     """
-    Transforms a single projected point (Easting, Northing) to geographical
-    coordinates (Latitude, Longitude).
+    Transforms projected points (Eastings, Northings) to geographical
+    coordinates (Latitudes, Longitudes) in a single pyproj call, or in
+    parallel chunks for batches of PARALLEL_TRANSFORM_MIN_POINTS or more.
 
     Args:
-        e (float): Easting coordinate.
-        n (float): Northing coordinate.
+        es (numpy.ndarray): Easting coordinates.
+        ns (numpy.ndarray): Northing coordinates.
         transformer_to_latlon (pyproj.Transformer): Transformer object.
-        point_desc_for_log (str): Description of the point for logging.
-        lot_name_for_log (str): Lot name for logging.
+        label_for_log (str): Lot name (or batch description) for logging.
 
     Returns:
-        list or None: A list [latitude, longitude] on success, or None on failure.
+        tuple or None: (lats, lons, finite_mask) arrays on success, where
+                       'finite_mask' flags the points PROJ could transform,
+                       or None if the transformation failed outright.
     """
     # current_app is now imported at module level
     if not transformer_to_latlon:
         current_app.logger.warning(
-            f"Lot '{lot_name_for_log}': Transformer to Lat/Lon not available "
-            f"for {point_desc_for_log}."
+            f"{label_for_log}: Transformer to Lat/Lon not available."
         )
         return None
     try:
-        lon, lat = transformer_to_latlon.transform(e, n)
-        return [lat, lon]
+        if isinstance(transformer_to_latlon, IdentityTransformer):
+            lons, lats = es, ns  # Target CRS is WGS84 already
+        elif _transform_executor and len(es) >= PARALLEL_TRANSFORM_MIN_POINTS:
+            bounds = np.linspace(0, len(es), _TRANSFORM_WORKERS + 1).astype(int)
+            chunks = list(_transform_executor.map(
+                lambda span: transformer_to_latlon.transform(
+                    es[span[0]:span[1]], ns[span[0]:span[1]]
+                ),
+                zip(bounds[:-1], bounds[1:])
+            ))
+            lons = np.concatenate([chunk[0] for chunk in chunks])
+            lats = np.concatenate([chunk[1] for chunk in chunks])
+        else:
+            lons, lats = transformer_to_latlon.transform(es, ns)
     except Exception as err_transform:
         current_app.logger.error(
-            f"Lot '{lot_name_for_log}': Error transforming {point_desc_for_log} "
-            f"(E:{e}, N:{n}) to Lat/Lon: {str(err_transform)}"
+            f"{label_for_log}: Error transforming {len(es)} point(s) "
+            f"to Lat/Lon: {str(err_transform)}"
         )
         return None
 
+    finite_mask = np.isfinite(lats) & np.isfinite(lons)
+    return lats, lons, finite_mask
+
+
+def _course_deltas(azimuths_deg, distances):
+    """
+    Converts survey courses into Easting/Northing deltas.
+
+    Args:
+        azimuths_deg (numpy.ndarray): Azimuth of each course in decimal degrees.
+        distances (numpy.ndarray): Distance of each course.
+
+    Returns:
+        tuple: (delta_es, delta_ns) arrays, one entry per course.
+    """
+    azimuths_rad = np.radians(azimuths_deg)
+    return distances * np.sin(azimuths_rad), distances * np.cos(azimuths_rad)
+
+
+def _walk_traverses(delta_es, delta_ns, course_counts, ref_e, ref_n):
+    """
+    Walks the traverses of several lots from a shared reference point at once.
+
+    The flat per-course deltas are scattered into zero-padded
+    (lots x stations) matrices whose first column is the reference point, and
+    a single row-wise cumulative sum produces every station of every lot.
+    Padding only ever adds zeros after a lot's last station, so each row's
+    values match walking that lot on its own.
+
+    Args:
+        delta_es (numpy.ndarray): Easting delta of each course, lot after lot.
+        delta_ns (numpy.ndarray): Northing delta of each course, lot after lot.
+        course_counts (list): Number of courses of each lot (all > 0).
+        ref_e (float): Easting of the reference point.
+        ref_n (float): Northing of the reference point.
+
+    Returns:
+        tuple: (station_es, station_ns, station_mask). The station matrices
+               hold one lot per row; in each row, index 0 is the reference
+               point, index 1 the POB and the rest are parcel vertices, up to
+               index course_count. 'station_mask' flags the real (unpadded)
+               stations.
+    """
+    counts = np.asarray(course_counts)
+    columns = np.arange(counts.max() + 1)
+    station_mask = columns[np.newaxis, :] <= counts[:, np.newaxis]
+    course_mask = station_mask.copy()
+    course_mask[:, 0] = False
+
+    station_es = np.zeros(station_mask.shape, dtype=np.float64)
+    station_ns = np.zeros(station_mask.shape, dtype=np.float64)
+    station_es[:, 0] = ref_e
+    station_ns[:, 0] = ref_n
+    # Boolean assignment fills row by row, matching the lot-after-lot order
+    station_es[course_mask] = delta_es
+    station_ns[course_mask] = delta_ns
+    np.cumsum(station_es, axis=1, out=station_es)
+    np.cumsum(station_ns, axis=1, out=station_ns)
+    return station_es, station_ns, station_mask
+
+
+def _measure_traverse(station_es, station_ns):
+    """
+    Measures the misclosure and enclosed area of one walked traverse.
+
+    The misclosure (last station back to the POB) and the parcel area are
+    taken from the station arrays directly, without building an explicitly
+    closed copy of the ring.
+
+    Args:
+        station_es (numpy.ndarray): Station Eastings (reference point, POB,
+                                    parcel vertices).
+        station_ns (numpy.ndarray): Station Northings, in the same order.
+
+    Returns:
+        tuple: (misclosure_distance, misclosure_azimuth_deg, area). The
+               misclosure values are None when there is no parcel boundary
+               course after the tie-line; the area is None unless the parcel
+               ring (once closed) has at least 4 vertices.
+    """
+    if len(station_es) < 3:
+        return None, None, None
+
+    delta_e = float(station_es[-1] - station_es[1])
+    delta_n = float(station_ns[-1] - station_ns[1])
+    misclosure_distance = math.hypot(delta_e, delta_n)
+    misclosure_azimuth_deg = math.degrees(math.atan2(delta_e, delta_n)) % 360.0
+
+    # The ring is closed implicitly when the last station is not the POB, so
+    # it needs at least 3 parcel stations in that case and 4 otherwise.
+    ring_is_closed = delta_e == 0.0 and delta_n == 0.0
+    ring_vertex_count = len(station_es) - 1 + (0 if ring_is_closed else 1)
+    area = None
+    if ring_vertex_count >= 4: # Need at least 3 unique points forming a closed polygon
+        area = _shoelace_area(station_es[1:], station_ns[1:])
+    return misclosure_distance, misclosure_azimuth_deg, area
+
+
+def _shoelace_area(es, ns):
+    """
+    Calculates the area of a ring with the shoelace formula.
+
+    The ring is treated as implicitly closed, so a repeated closing vertex is
+    optional. Coordinates are shifted to the first vertex before summing to
+    avoid cancellation with large projected values.
+
+    Args:
+        es (numpy.ndarray): Easting of each ring vertex.
+        ns (numpy.ndarray): Northing of each ring vertex.
+
+    Returns:
+        float: The enclosed area in square units of the projected CRS.
+    """
+    xs = es - es[0]
+    ys = ns - ns[0]
+    return 0.5 * abs(float(np.dot(xs, np.roll(ys, -1)) - np.dot(ys, np.roll(xs, -1))))
 
-# --- Main lot calculation function ---
 
-def _calculate_single_lot_geometry(
-        transformer_to_latlon, ref_e, ref_n, survey_lines_text_for_lot,
-        lot_id="unknown", lot_name="Unknown Lot"
+def _build_lot_geometry_result(
+        lot_id, lot_name, ref_e, ref_n, station_es, station_ns,
+        misclosure_distance_val, misclosure_azimuth_deg_val, raw_area_sqm,
+        transformed
     ):
     """
-    Calculates the geometry (projected and lat/lon coordinates) for a single lot
-    based on its survey lines text, starting from a reference point.
+    Assembles the result dictionary for one walked traverse.
+
+    The closed parcel rings are gathered from the station arrays with an index
+    array (repeating the POB at the end when the traverse does not already
+    return to it), so each coordinate list is materialized exactly once.
+    Both rings are also kept as (N, 2) float64 arrays, 'parcel_ring_ens' and
+    the lon/lat (x/y order) 'parcel_ring_lonlats', for exporters that work on
+    arrays; neither is part of the JSON returned to the frontend. Whether each ring is
+    closed (first vertex equal to the last) is decided here as well, under
+    'projected'/'is_closed' and 'parcel_ring_is_closed', so exporters do not
+    compare the end vertices again.
 
     Args:
-        transformer_to_latlon (pyproj.Transformer): Transformer for projected to lat/lon.
-        ref_e (float): Easting of the main reference point for this lot.
-        ref_n (float): Northing of the main reference point for this lot.
-        survey_lines_text_for_lot (str): Multiline string of survey lines.
         lot_id (str): Identifier for the lot.
         lot_name (str): Name of the lot.
+        ref_e (float): Easting of the reference point.
+        ref_n (float): Northing of the reference point.
+        station_es (numpy.ndarray): Station Eastings from _walk_traverses().
+        station_ns (numpy.ndarray): Station Northings from _walk_traverses().
+        misclosure_distance_val (float or None): Raw misclosure distance.
+        misclosure_azimuth_deg_val (float or None): Raw misclosure azimuth.
+        raw_area_sqm (float or None): Raw parcel area from _measure_traverse().
+        transformed (tuple or None): (lats, lons, finite_mask) for the same
+                                     stations, or None if not available.
 
     Returns:
-        dict: A dictionary containing the lot's ID, name, status ('success',
-              'error', or 'nodata'), and calculated 'projected' and 'latlon'
-              coordinates. Includes a 'message' field on error or for nodata.
+        dict: A 'success' result as described in _calculate_lots_geometry().
     """
-    # current_app is now imported at module level
+    parcel_ring_lonlats = np.empty((0, 2))
+    parcel_ring_is_closed = False
     lot_proj_coords = {
         "pob_en": None,
         "tie_line_ens": [],
-        "parcel_boundary_ens": []
+        "parcel_boundary_ens": [],
+        "is_closed": True  # The projected ring always ends back on the POB
     }
     lot_latlon_coords = {
         "pob_latlng": None,
         "tie_line_latlngs": [],
         "parcel_polygon_latlngs": []
     }
-    
-    current_e, current_n = ref_e, ref_n
-    survey_lines = [
-        line for line in survey_lines_text_for_lot.splitlines() if line.strip()
-    ]
 
-    if not survey_lines:
-        return {
-            "status": "nodata", "lot_id": lot_id, "lot_name": lot_name,
-            "projected": lot_proj_coords, "latlon": lot_latlon_coords,
-            "message": f"Lot '{lot_name}' has no survey lines."
-        }
+    # Parcel ring: POB onwards, closed back to the POB if necessary
+    ring_needs_closing = station_es[1] != station_es[-1] or station_ns[1] != station_ns[-1]
+    ring_index = np.arange(1, len(station_es))
+    if ring_needs_closing:
+        ring_index = np.append(ring_index, 1)
 
-    # Process POB (first line)
-    pob_result = _parse_and_calculate_next_point(
-        survey_lines[0], current_e, current_n, 1, lot_name, "tie-line to POB"
-    )
-    if pob_result["status"] == "error":
-        return {
-            "status": "error", "lot_id": lot_id, "lot_name": lot_name,
-            "message": pob_result["message"]
-        }
-    
-    pob_e, pob_n = pob_result["e"], pob_result["n"]
+    pob_e, pob_n = float(station_es[1]), float(station_ns[1])
     lot_proj_coords["pob_en"] = (pob_e, pob_n)
-    lot_proj_coords["tie_line_ens"] = [(current_e, current_n), (pob_e, pob_n)] 
-    lot_proj_coords["parcel_boundary_ens"].append((pob_e, pob_n))
-
-    # Transform reference point and POB to Lat/Lon
-    ref_latlon = _transform_point_to_latlon(
-        ref_e, ref_n, transformer_to_latlon,
-        "Reference Point for Tie-Line", lot_name
-    )
-    pob_latlon = _transform_point_to_latlon(
-        pob_e, pob_n, transformer_to_latlon, "POB", lot_name
+    lot_proj_coords["tie_line_ens"] = [(ref_e, ref_n), (pob_e, pob_n)]
+    parcel_ring_ens = np.column_stack((station_es[ring_index], station_ns[ring_index]))
+    lot_proj_coords["parcel_boundary_ens"] = list(
+        zip(parcel_ring_ens[:, 0].tolist(), parcel_ring_ens[:, 1].tolist())
     )
 
-    if ref_latlon and pob_latlon:
-        lot_latlon_coords["pob_latlng"] = pob_latlon
-        lot_latlon_coords["tie_line_latlngs"] = [ref_latlon, pob_latlon]
-        lot_latlon_coords["parcel_polygon_latlngs"].append(pob_latlon)
-    # Note: If transformations fail, messages are logged by _transform_point_to_latlon.
-    # The function proceeds; downstream users handle missing latlon data.
-
-    current_e, current_n = pob_e, pob_n
-
-    # Process subsequent lines for parcel boundary
-    for i, line_str in enumerate(survey_lines[1:], start=2):
-        vertex_result = _parse_and_calculate_next_point(
-            line_str, current_e, current_n, i, lot_name, "parcel boundary"
-        )
-        if vertex_result["status"] == "error":
-            return {
-                "status": "error", "lot_id": lot_id, "lot_name": lot_name,
-                "message": vertex_result["message"]
-            }
-
-        next_e, next_n = vertex_result["e"], vertex_result["n"]
-        lot_proj_coords["parcel_boundary_ens"].append((next_e, next_n))
-        
-        vertex_latlon = _transform_point_to_latlon(
-            next_e, next_n, transformer_to_latlon, f"Vertex {i-1}", lot_name
+    if transformed:
+        lats, lons, finite_mask = transformed
+        if not finite_mask.all():
+            current_app.logger.warning(
+                f"Lot '{lot_name}': {int((~finite_mask).sum())} point(s) "
+                f"could not be transformed to Lat/Lon."
+            )
+        latlng_index = np.flatnonzero(finite_mask[2:]) + 2
+        if finite_mask[0] and finite_mask[1]:
+            pob_latlng = [float(lats[1]), float(lons[1])]
+            lot_latlon_coords["pob_latlng"] = pob_latlng
+            lot_latlon_coords["tie_line_latlngs"] = [[float(lats[0]), float(lons[0])], pob_latlng]
+            latlng_index = np.concatenate(([1], latlng_index))
+        if ring_needs_closing and len(latlng_index) > 0 and (
+                lats[latlng_index[0]] != lats[latlng_index[-1]] or
+                lons[latlng_index[0]] != lons[latlng_index[-1]]):
+            latlng_index = np.append(latlng_index, latlng_index[0])
+        parcel_ring_lonlats = np.column_stack((lons[latlng_index], lats[latlng_index]))
+        parcel_ring_is_closed = len(latlng_index) > 0 and bool(
+            np.array_equal(parcel_ring_lonlats[0], parcel_ring_lonlats[-1])
         )
-        if vertex_latlon:
-            lot_latlon_coords["parcel_polygon_latlngs"].append(vertex_latlon)
-        
-        current_e, current_n = next_e, next_n
+        lot_latlon_coords["parcel_polygon_latlngs"] = parcel_ring_lonlats[:, ::-1].tolist()
+    # Note: If transformations fail, messages are logged by _transform_points_to_latlon.
+    # The function proceeds; downstream users handle missing latlon data.
     
-    # Calculate Misclosure (before auto-closing the polygon)
-    misclosure_distance_val = None
-    misclosure_azimuth_deg_val = None
+    # Misclosure is measured on the open traverse, before the ring is closed
     misclosure_data_for_return = {
-        "distance_raw": None,
-        "azimuth_raw_deg": None
+        "distance_raw": misclosure_distance_val,
+        "azimuth_raw_deg": misclosure_azimuth_deg_val
         # Formatted strings will be added by the calling endpoint
     }
 
-    if len(lot_proj_coords["parcel_boundary_ens"]) >= 2:
-        pob_en = lot_proj_coords["parcel_boundary_ens"][0]
-        actual_last_calculated_point_en = lot_proj_coords["parcel_boundary_ens"][-1]
-
-        delta_e = actual_last_calculated_point_en[0] - pob_en[0]
-        delta_n = actual_last_calculated_point_en[1] - pob_en[1]
-
-        misclosure_distance_val = math.sqrt(delta_e**2 + delta_n**2)
-        
-        misclosure_azimuth_rad = math.atan2(delta_e, delta_n)
-        misclosure_azimuth_deg_val = math.degrees(misclosure_azimuth_rad)
-        if misclosure_azimuth_deg_val < 0:
-            misclosure_azimuth_deg_val += 360.0
-        
-        misclosure_data_for_return["distance_raw"] = misclosure_distance_val
-        misclosure_data_for_return["azimuth_raw_deg"] = misclosure_azimuth_deg_val
-
-    # Close the polygon if necessary
-    parcel_ens = lot_proj_coords["parcel_boundary_ens"]
-    parcel_latlngs = lot_latlon_coords["parcel_polygon_latlngs"]
-
-    if len(parcel_ens) > 1 and parcel_ens[0] != parcel_ens[-1]:
-        parcel_ens.append(parcel_ens[0]) # Close the projected coordinates
-        if parcel_latlngs and len(parcel_latlngs) > 0 and \
-           parcel_latlngs[0] != parcel_latlngs[-1]:
-            # Ensure the first point's lat/lon is available before appending
-            first_vertex_latlon = parcel_latlngs[0]
-            parcel_latlngs.append(first_vertex_latlon) # Close the lat/lon coordinates
-    
-    # Calculate Raw Area
-    raw_area_sqm = None
-    if len(parcel_ens) >= 4: # Need at least 3 unique points forming a closed polygon
-        try:
-            # parcel_ens should already be a list of (E,N) tuples
-            shapely_polygon = Polygon(parcel_ens)
-            if shapely_polygon.is_valid:
-                raw_area_sqm = shapely_polygon.area
-            else:
-                current_app.logger.warning(f"Lot '{lot_name}': Calculated polygon is not valid.")
-        except Exception as e:
-            current_app.logger.error(f"Lot '{lot_name}': Error calculating area: {str(e)}")
-            # raw_area_sqm remains None
-            
     return {
         "status": "success",
         "lot_id": lot_id,
         "lot_name": lot_name,
         "projected": lot_proj_coords,
         "latlon": lot_latlon_coords,
+        "parcel_ring_ens": parcel_ring_ens,
+        "parcel_ring_lonlats": parcel_ring_lonlats,
+        "parcel_ring_is_closed": parcel_ring_is_closed,
         "misclosure": misclosure_data_for_return,
         "area_sqm_raw": raw_area_sqm # New key
     }
 
 
+# --- Main lot calculation functions ---
+
+def _calculate_lots_geometry(transformer_to_latlon, ref_e, ref_n, lot_specs):
+    """
+    Calculates the geometry (projected and lat/lon coordinates) for several
+    lots that share one reference point.
+
+    The work is batched across lots: the course deltas and traverse walks of
+    every lot are computed in single vectorized passes and all stations of
+    all lots are transformed to lat/lon in a single pyproj call, so the
+    per-request cost no longer grows with one round of NumPy/PROJ calls per
+    lot. Only the per-lot misclosure/area and result assembly remain in the
+    Python loop.
+
+    Args:
+        transformer_to_latlon (pyproj.Transformer): Transformer for projected to lat/lon.
+        ref_e (float): Easting of the main reference point.
+        ref_n (float): Northing of the main reference point.
+        lot_specs (list): (survey_lines_text, lot_id, lot_name) tuples.
+
+    Returns:
+        list: One dictionary per entry of 'lot_specs', in the same order,
+              containing the lot's ID, name, status ('success', 'error', or
+              'nodata'), and calculated 'projected' and 'latlon' coordinates.
+              Includes a 'message' field on error or for nodata.
+    """
+    # current_app is now imported at module level
+    results = [None] * len(lot_specs)
+    walked_lots = []  # (result index, course count) for lots with courses
+    azimuth_chunks = []
+    distance_chunks = []
+
+    # --- Phase 1: parse every lot (memoized per lines text) ---
+    for result_index, (survey_lines_text, lot_id, lot_name) in enumerate(lot_specs):
+        azimuths, distances, parse_error = _parse_lot_lines(survey_lines_text)
+
+        if parse_error:
+            line_num, line_str, reason = parse_error
+            line_description = "tie-line to POB" if line_num == 1 else "parcel boundary"
+            results[result_index] = {
+                "status": "error", "lot_id": lot_id, "lot_name": lot_name,
+                "message": f"Lot '{lot_name}': {reason} {line_description} (line {line_num}): {line_str}"
+            }
+        elif not len(azimuths):
+            results[result_index] = {
+                "status": "nodata", "lot_id": lot_id, "lot_name": lot_name,
+                "projected": {
+                    "pob_en": None, "tie_line_ens": [], "parcel_boundary_ens": []
+                },
+                "latlon": {
+                    "pob_latlng": None, "tie_line_latlngs": [], "parcel_polygon_latlngs": []
+                },
+                "message": f"Lot '{lot_name}' has no survey lines."
+            }
+        else:
+            walked_lots.append((result_index, len(azimuths)))
+            azimuth_chunks.append(azimuths)
+            distance_chunks.append(distances)
+
+    if not walked_lots:
+        return results
+
+    # --- Phase 2: course deltas and traverse walks for all lots at once ---
+    delta_es, delta_ns = _course_deltas(
+        np.concatenate(azimuth_chunks), np.concatenate(distance_chunks)
+    )
+    course_counts = [course_count for _, course_count in walked_lots]
+    station_es, station_ns, station_mask = _walk_traverses(
+        delta_es, delta_ns, course_counts, ref_e, ref_n
+    )
+
+    # --- Phase 3: one lat/lon transform over the stations of every lot ---
+    transformed = _transform_points_to_latlon(
+        station_es[station_mask], station_ns[station_mask],
+        transformer_to_latlon,
+        f"Lot '{lot_specs[walked_lots[0][0]][2]}'" if len(walked_lots) == 1
+        else f"Batch of {len(walked_lots)} lots"
+    )
+
+    station_start = 0
+    for row, (result_index, course_count) in enumerate(walked_lots):
+        lot_station_es = station_es[row, :course_count + 1]
+        lot_station_ns = station_ns[row, :course_count + 1]
+        station_end = station_start + course_count + 1
+        lot_transformed = None
+        if transformed:
+            lot_transformed = tuple(
+                arr[station_start:station_end] for arr in transformed
+            )
+        _, lot_id, lot_name = lot_specs[result_index]
+        results[result_index] = _build_lot_geometry_result(
+            lot_id, lot_name, ref_e, ref_n, lot_station_es, lot_station_ns,
+            *_measure_traverse(lot_station_es, lot_station_ns),
+            lot_transformed
+        )
+        station_start = station_end
+
+    return results
+
+
+# Encoded reference points served by /api/reference_points, kept for as long
+# as load_reference_points() returns the same records list.
+_reference_points_json_cache = {'entry': None}  # 'entry' is (records, body, etag)
+
+
+def _reference_points_json(ref_pts):
+    """
+    Returns the reference points encoded as JSON, with an entity tag.
+
+    The records only change with the CSV, so they are encoded (and hashed)
+    once per records list rather than on every request.
+
+    Args:
+        ref_pts (list): Reference point records from load_reference_points().
+
+    Returns:
+        tuple: (body, etag) where 'body' is the JSON bytes and 'etag' is a
+               digest of them.
+    """
+    entry = _reference_points_json_cache['entry']
+    if entry is None or entry[0] is not ref_pts:
+        body = orjson.dumps(ref_pts)
+        entry = (ref_pts, body, hashlib.blake2b(body, digest_size=16).hexdigest())
+        _reference_points_json_cache['entry'] = entry
+    return entry[1], entry[2]
+
+
 @app.route('/')
 @limiter.limit("20 per minute")
 def index():
@@ -512,16 +978,43 @@ def index():
     # and app context is guaranteed. Sticking to app.logger for this specific line.
     app.logger.info("Index route called.") # Or current_app.logger.info(...)
     
-    ref_pts, csv_err_msg = load_reference_points()
+    ref_pts, _, csv_err_msg = load_reference_points()
     return render_template(
         'index.html',
         reference_points_data=ref_pts,
-        reference_points_data_json=json.dumps(ref_pts),
         csv_error_message=csv_err_msg if not ref_pts else None,
         selected_ref_point_name=None # No pre-selection
     )
 
 
+# Browsers may reuse /api/reference_points for this long before revalidating
+# it with its ETag.
+REFERENCE_POINTS_MAX_AGE_SECONDS = 300
+
+
+@app.route('/api/reference_points', methods=['GET'])
+@limiter.limit("60 per minute;500 per day") # Standard limit for API utilities
+def reference_points_endpoint():
+    """
+    Returns all reference points as JSON.
+
+    Returns JSON: a list of {"display_name": str, "EASTINGS": float,
+    "NORTHINGS": float}, or {"status": "error", "message": str} if the
+    reference file could not be loaded. Responses carry an ETag and answer
+    If-None-Match with 304.
+    """
+    ref_pts, _, csv_err_msg = load_reference_points()
+    if not ref_pts and csv_err_msg:
+        return jsonify({"status": "error", "message": csv_err_msg}), 500
+
+    body, etag = _reference_points_json(ref_pts)
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = REFERENCE_POINTS_MAX_AGE_SECONDS
+    return response.make_conditional(request)
+
+
 @app.route('/api/transform_to_projected', methods=['POST'])
 @limiter.limit("60 per minute;500 per day") # Standard limit for API utilities
 def transform_to_projected_endpoint():
@@ -561,17 +1054,23 @@ def transform_to_projected_endpoint():
             "message": "Target CRS EPSG must be a string (e.g., '32651')."
         }), 400
 
-    source_crs_epsg = 4326  # WGS84
+    # Reuse the cached WGS84 -> target transformer (see gis_utils) instead of
+    # building a new PROJ pipeline on every request.
+    transformer_to_projected, err_msg_transformer = get_transformer_to_projected(target_crs_epsg)
+    if err_msg_transformer:
+        current_app.logger.error(
+            f"Invalid target_crs_epsg '{target_crs_epsg}' in "
+            f"/api/transform_to_projected. Lat: {latitude}, Lon: {longitude}"
+        )
+        return jsonify({
+            "status": "error",
+            "message": f"Invalid target CRS provided: EPSG:{target_crs_epsg}. Please check the EPSG code."
+        }), 400
 
     try:
-        # pyproj expects (longitude, latitude) for geographic CRS when always_xy=True
-        # and returns (easting, northing) for projected CRS.
-        transformer = Transformer.from_crs(
-            f"EPSG:{source_crs_epsg}", 
-            f"EPSG:{target_crs_epsg}", 
-            always_xy=True # Ensures Lon,Lat input order for geographic, E,N output for projected
-        )
-        easting, northing = transformer.transform(longitude, latitude) # Input order: Lon, Lat
+        # The transformer uses always_xy=True: it expects (longitude, latitude)
+        # and returns (easting, northing) for the projected CRS.
+        easting, northing = transformer_to_projected.transform(longitude, latitude) # Input order: Lon, Lat
 
         return jsonify({
             "status": "success",
@@ -579,15 +1078,6 @@ def transform_to_projected_endpoint():
             "northing": northing
         }), 200
 
-    except CRSError:
-        current_app.logger.error(
-            f"CRSError for target_crs_epsg '{target_crs_epsg}' in "
-            f"/api/transform_to_projected. Lat: {latitude}, Lon: {longitude}"
-        )
-        return jsonify({
-            "status": "error",
-            "message": f"Invalid target CRS provided: EPSG:{target_crs_epsg}. Please check the EPSG code."
-        }), 400
     except Exception as e:
         current_app.logger.error(
             f"Transformation failed in /api/transform_to_projected for "
@@ -600,28 +1090,43 @@ def transform_to_projected_endpoint():
         }), 500
 
 
-@app.route('/calculate_plot_data_multi', methods=['POST'])
-@limiter.limit("30 per minute;100 per hour")
-def calculate_plot_data_multi_endpoint():
+def _resolve_main_reference(request_data, transformer_to_latlon, log_prefix):
     """
-    Calculates plot data for multiple lots based on JSON input.
+    Determines the main reference point of a plot or export request.
 
-    Receives survey data and reference point information, then computes
-    projected and geographical coordinates for plotting on a map.
+    Client-provided coordinates ('main_ref_e'/'main_ref_n') take precedence;
+    if they are absent or unparsable, the point selected by name
+    ('reference_point_select') is looked up in the reference points CSV.
+    The resolved point is also transformed to Lat/Lon once, for every
+    consumer of the request.
+
+    Args:
+        request_data (dict): The JSON data from the request.
+        transformer_to_latlon: Transformer from the target CRS to Lat/Lon.
+        log_prefix (str): Prefix for log messages (e.g. "Export (KMZ): ").
+
+    Returns:
+        tuple: (reference, error_response_tuple). 'reference' is a dictionary
+               with 'main_ref_e' and 'main_ref_n' (None if no reference point
+               was given), 'main_ref_transformed_lonlat' ((lon, lat), or None
+               if unavailable) and 'using_client_ref_coords'.
+               'error_response_tuple' is (jsonify_object, status_code) if the
+               reference points could not be loaded or the selected point does
+               not exist, otherwise None.
     """
-    data = request.get_json()
-    if not data:
-        return jsonify({"status": "error", "message": "No JSON data provided."}), 400
-    
-    target_crs_epsg_str = data.get(
-        'target_crs_select', str(DEFAULT_TARGET_CRS_EPSG)
-    )
-    selected_display_name = data.get('reference_point_select')
-    lots_data_from_payload = data.get('lots', [])
+    main_ref_e_client = request_data.get('main_ref_e')
+    main_ref_n_client = request_data.get('main_ref_n')
+    selected_display_name = request_data.get('reference_point_select')
+
+    _, ref_pts_by_name, csv_err_msg = load_reference_points()
+    if csv_err_msg:
+        # csv_err_msg is already a user-friendly message
+        current_app.logger.error(f"{log_prefix}Error loading reference points: {csv_err_msg}")
+        return None, (jsonify({
+            "status": "error",
+            "message": f"Failed to load reference points: {csv_err_msg}"
+        }), 500)
 
-    # --- Determine Main Reference Coordinates ---
-    main_ref_e_client = data.get('main_ref_e')
-    main_ref_n_client = data.get('main_ref_n')
     main_ref_e = None
     main_ref_n = None
     using_client_ref_coords = False
@@ -631,17 +1136,71 @@ def calculate_plot_data_multi_endpoint():
             main_ref_e = float(main_ref_e_client)
             main_ref_n = float(main_ref_n_client)
             using_client_ref_coords = True
-            current_app.logger.info(f"Using client-provided reference coordinates: E {main_ref_e}, N {main_ref_n}")
-        except ValueError:
+            current_app.logger.info(
+                f"{log_prefix}Using client-provided reference: E {main_ref_e}, N {main_ref_n}"
+            )
+        except (TypeError, ValueError):
             current_app.logger.warning(
-                f"Could not parse client-provided main_ref_e ('{main_ref_e_client}') or "
+                f"{log_prefix}Could not parse client main_ref_e ('{main_ref_e_client}') or "
                 f"main_ref_n ('{main_ref_n_client}') as float. Falling back to selected reference point name."
             )
             main_ref_e = None # Ensure fallback
             main_ref_n = None # Ensure fallback
-            using_client_ref_coords = False # Explicitly set for clarity
 
-    transformer_to_latlon, _, err_msg_transformer = get_transformers(
+    if not using_client_ref_coords and selected_display_name:
+        selected_point_details = ref_pts_by_name.get(selected_display_name)
+        if not selected_point_details:
+            msg = (
+                f"The selected reference point '{selected_display_name}' "
+                f"could not be found. Please check your selection."
+            )
+            return None, (jsonify({"status": "error", "message": msg}), 400)
+        # Coordinates are already floats (converted once in load_reference_points)
+        main_ref_e = selected_point_details['EASTINGS']
+        main_ref_n = selected_point_details['NORTHINGS']
+        current_app.logger.info(
+            f"{log_prefix}Using reference from CSV '{selected_display_name}': E {main_ref_e}, N {main_ref_n}"
+        )
+
+    main_ref_transformed_lonlat = None
+    if transformer_to_latlon and main_ref_e is not None and main_ref_n is not None:
+        try:
+            # pyproj always_xy=True: (easting, northing) -> (lon, lat)
+            main_ref_transformed_lonlat = transformer_to_latlon.transform(main_ref_e, main_ref_n)
+        except Exception as e_tx:
+            # Projected E/N remain usable; consumers handle a missing Lat/Lon.
+            current_app.logger.error(
+                f"{log_prefix}Error transforming reference point (E:{main_ref_e}, "
+                f"N:{main_ref_n}) to Lat/Lon: {str(e_tx)}", exc_info=True
+            )
+
+    return {
+        "main_ref_e": main_ref_e,
+        "main_ref_n": main_ref_n,
+        "main_ref_transformed_lonlat": main_ref_transformed_lonlat,
+        "using_client_ref_coords": using_client_ref_coords,
+    }, None
+
+
+@app.route('/calculate_plot_data_multi', methods=['POST'])
+@limiter.limit("30 per minute;100 per hour")
+def calculate_plot_data_multi_endpoint():
+    """
+    Calculates plot data for multiple lots based on JSON input.
+
+    Receives survey data and reference point information, then computes
+    projected and geographical coordinates for plotting on a map.
+    """
+    data = request.get_json()
+    if not data:
+        return jsonify({"status": "error", "message": "No JSON data provided."}), 400
+    
+    target_crs_epsg_str = data.get(
+        'target_crs_select', str(DEFAULT_TARGET_CRS_EPSG)
+    )
+    lots_data_from_payload = data.get('lots', [])
+
+    transformer_to_latlon, err_msg_transformer = get_transformer_to_latlon(
         target_crs_epsg_str
     )
     if err_msg_transformer:
@@ -649,40 +1208,23 @@ def calculate_plot_data_multi_endpoint():
             "status": "error", "message": err_msg_transformer
         }), 400
 
-    ref_pts_list, csv_err_msg = load_reference_points()
-    if csv_err_msg:
-        # Assuming csv_err_msg from load_reference_points is user-friendly
-        return jsonify({
-            "status": "error", "message": f"Reference point data error: {csv_err_msg}"
-        }), 500
-
-    if not using_client_ref_coords:
-        if selected_display_name:
-            selected_point_details = next(
-                (p for p in ref_pts_list if p['display_name'] == selected_display_name),
-                None
-            )
-            if not selected_point_details:
-                return jsonify({
-                    "status": "error",
-                    "message": f"Selected reference point '{selected_display_name}' not found."
-                }), 400
-            try:
-                main_ref_e = float(selected_point_details['EASTINGS'])
-                main_ref_n = float(selected_point_details['NORTHINGS'])
-                current_app.logger.info(f"Using reference coordinates from selected point '{selected_display_name}': E {main_ref_e}, N {main_ref_n}")
-            except ValueError:
-                # This error means the CSV data for the selected point is bad.
-                return jsonify({
-                    "status": "error",
-                    "message": f"Invalid coordinates for the selected main reference point '{selected_display_name}' in the reference data."
-                }), 400
-        # If not using_client_ref_coords AND no selected_display_name, 
-        # main_ref_e/n will remain None. This is handled below.
+    # --- Determine Main Reference Coordinates ---
+    # With neither client coordinates nor a selected point, main_ref_e/n are
+    # None. This is handled below.
+    main_reference, error_response_tuple = _resolve_main_reference(
+        data, transformer_to_latlon, ""
+    )
+    if error_response_tuple:
+        return error_response_tuple
+    main_ref_e = main_reference["main_ref_e"]
+    main_ref_n = main_reference["main_ref_n"]
 
     # Check if reference coordinates are established if lot data is present
     # This check is crucial if lots_data_from_payload has items that contain actual survey lines.
-    has_lines_in_payload = any(lot.get('lines_text', '').strip() for lot in lots_data_from_payload)
+    has_lines_in_payload = isinstance(lots_data_from_payload, list) and any(
+        isinstance(lot, dict) and isinstance(lot.get('lines_text'), str) and lot['lines_text'].strip()
+        for lot in lots_data_from_payload
+    )
 
     if main_ref_e is None or main_ref_n is None:
         if not lots_data_from_payload or not has_lines_in_payload: 
@@ -702,17 +1244,10 @@ def calculate_plot_data_multi_endpoint():
     # Or, if no lots with lines are present, main_ref_e/n might still be None, but that's fine if only a ref point is plotted.
 
     reference_plot_data = {"reference_marker_latlng": None}
-    if transformer_to_latlon and main_ref_e is not None and main_ref_n is not None:
-        try:
-            # Transform the determined main_ref_e, main_ref_n to Lat/Lon for map display
-            ref_lon, ref_lat = transformer_to_latlon.transform(main_ref_e, main_ref_n)
-            reference_plot_data["reference_marker_latlng"] = [ref_lat, ref_lon]
-        except Exception as e:
-            current_app.logger.error(
-                f"Error transforming main ref point (E:{main_ref_e}, N:{main_ref_n}) to Lat/Lon for plotting: {str(e)}",
-                exc_info=True
-            )
-            # If transformation fails, reference_marker_latlng remains None, map won't show it.
+    if main_reference["main_ref_transformed_lonlat"]:
+        # If the transformation failed, the map simply won't show the marker.
+        ref_lon, ref_lat = main_reference["main_ref_transformed_lonlat"]
+        reference_plot_data["reference_marker_latlng"] = [ref_lat, ref_lon]
 
     results_per_lot = []
     any_lot_had_error = False
@@ -733,26 +1268,26 @@ def calculate_plot_data_multi_endpoint():
     # The check "if main_ref_e is None or main_ref_n is None:" and has_lines_in_payload
     # should have already returned an error if they weren't.
 
+    # Validate every lot first and collect the computable ones, so their
+    # geometry can be calculated in one batch below.
+    lots_to_calculate = []  # (index into results_per_lot, lines_text, lot_id, lot_name)
     for index, lot_input in enumerate(lots_data_from_payload):
         # Skip processing for lots that don't have line data, but include them in results if they have a name/id
         # to maintain consistency with the frontend's expectation of receiving all lots back.
-        lines_text = lot_input.get('lines_text', "")
-        lot_id = lot_input.get('id', f"unknown_id_{index}")
-        lot_name = lot_input.get('name', f"Unnamed Lot {index+1}")
-
         if not isinstance(lot_input, dict):
             current_app.logger.warning(f"Skipping malformed lot entry at index {index}: not a dictionary. Entry: {lot_input}")
             results_per_lot.append({
-                "lot_id": lot_id, # Use extracted or default ID
-                "lot_name": lot_name, # Use extracted or default Name
+                "lot_id": f"unknown_id_{index}",
+                "lot_name": f"Unnamed Lot {index+1}",
                 "status": "error",
                 "message": "Lot data is not structured correctly (must be a dictionary)."
             })
             any_lot_had_error = True
             continue
-        
-        # Ensure lot_id and lot_name are properly assigned even if structure is bad.
-        # Already done above before the isinstance check.
+
+        lines_text = lot_input.get('lines_text', "")
+        lot_id = lot_input.get('id', f"unknown_id_{index}")
+        lot_name = lot_input.get('name', f"Unnamed Lot {index+1}")
 
         if not isinstance(lines_text, str) or not lines_text.strip(): # Check if lines_text is empty or not a string
             # If lines_text is empty or invalid, we still want to return this lot in the results
@@ -778,15 +1313,22 @@ def calculate_plot_data_multi_endpoint():
             continue
 
         # If we reach here, main_ref_e and main_ref_n are guaranteed to be valid,
-        # and lines_text is present and is a string.
-        single_lot_result = _calculate_single_lot_geometry(
-            transformer_to_latlon, main_ref_e, main_ref_n, lines_text, lot_id, lot_name
-        )
-        
+        # and lines_text is present and is a string. Reserve the result slot so
+        # the response keeps the payload order.
+        lots_to_calculate.append((len(results_per_lot), lines_text, lot_id, lot_name))
+        results_per_lot.append(None)
+
+    lot_geometry_results = _calculate_lots_geometry(
+        transformer_to_latlon, main_ref_e, main_ref_n,
+        [(lines_text, lot_id, lot_name) for _, lines_text, lot_id, lot_name in lots_to_calculate]
+    ) if lots_to_calculate else []
+
+    for (result_index, _, lot_id, lot_name), single_lot_result in zip(
+            lots_to_calculate, lot_geometry_results):
         if single_lot_result["status"] == "error":
             any_lot_had_error = True
         
-        results_per_lot.append({
+        results_per_lot[result_index] = {
             "lot_id": lot_id,
             "lot_name": lot_name,
             "status": single_lot_result["status"],
@@ -794,7 +1336,7 @@ def calculate_plot_data_multi_endpoint():
             "plot_data": single_lot_result.get("latlon", {}),
             "misclosure_raw": single_lot_result.get("misclosure", {"distance_raw": None, "azimuth_raw_deg": None}),
             "area_sqm_raw": single_lot_result.get("area_sqm_raw") # Store raw area
-        })
+        }
 
     overall_status = "success_with_errors" if any_lot_had_error else "success"
     
@@ -830,6 +1372,68 @@ def calculate_plot_data_multi_endpoint():
 # --- Refactored Export Helper Functions ---
 
 
+# --- Export Parameter Cache ---
+
+# Retries and double-submits of an export post the exact same payload; their
+# prepared parameters are reused for a short while instead of being rebuilt.
+EXPORT_PARAMS_CACHE_MAX_ENTRIES = 64
+EXPORT_PARAMS_CACHE_TTL_SECONDS = 60
+_export_params_cache = collections.OrderedDict()  # key -> (expires_at, params)
+_export_params_cache_lock = threading.Lock()
+
+
+def _prepare_export_data_cached(request_data, export_format_name):
+    """
+    Cached front for _prepare_export_data_for_routes.
+
+    Results are keyed by the export format, the reference data version (a
+    point selected by name resolves to the CSV's current coordinates) and a
+    BLAKE2b digest of the raw request body, and kept for
+    EXPORT_PARAMS_CACHE_TTL_SECONDS (at most EXPORT_PARAMS_CACHE_MAX_ENTRIES
+    entries, least recently used evicted first). Only successful preparations are cached; error responses are
+    always rebuilt.
+
+    Args:
+        request_data (dict): The JSON data from the request.
+        export_format_name (str): The name of the export format (e.g., "Shapefile").
+
+    Returns:
+        tuple: Same as _prepare_export_data_for_routes().
+    """
+    key = (
+        export_format_name,
+        _reference_points_version(),
+        hashlib.blake2b(request.get_data(cache=True), digest_size=16).digest()
+    )
+    now = time.monotonic()
+    with _export_params_cache_lock:
+        cached = _export_params_cache.get(key)
+        if cached and cached[0] > now:
+            _export_params_cache.move_to_end(key)
+            return cached[1], None
+
+    params, error_response_tuple = _prepare_export_data_for_routes(
+        request_data, export_format_name
+    )
+    if params is not None:
+        with _export_params_cache_lock:
+            _export_params_cache[key] = (now + EXPORT_PARAMS_CACHE_TTL_SECONDS, params)
+            _export_params_cache.move_to_end(key)
+            while len(_export_params_cache) > EXPORT_PARAMS_CACHE_MAX_ENTRIES:
+                _export_params_cache.popitem(last=False)
+    return params, error_response_tuple
+
+
+def _nothing_to_export_response(export_format_name):
+    """Builds the 400 response for an export payload with no reference point and no lots."""
+    msg = (
+        f"No reference point selected or client-provided, and no lot data "
+        f"provided. Please select a reference point or add lot details to "
+        f"export for {export_format_name}."
+    )
+    return jsonify({"status": "error", "message": msg}), 400
+
+
 def _prepare_export_data_for_routes(request_data, export_format_name):
     """
     Prepares common data needed for various export routes.
@@ -844,7 +1448,7 @@ def _prepare_export_data_for_routes(request_data, export_format_name):
     Returns:
         tuple: A tuple (params, error_response_tuple).
                'params' is a dictionary of prepared data on success.
-               'error_response_tuple' is (None, (jsonify_object, status_code))
+               'error_response_tuple' is (jsonify_object, status_code)
                if an error occurs, otherwise None.
     """
     target_crs_epsg_str = request_data.get(
@@ -852,107 +1456,41 @@ def _prepare_export_data_for_routes(request_data, export_format_name):
     )
     selected_display_name = request_data.get('reference_point_select')
     lots_data_from_payload = request_data.get('lots', [])
-    # current_app is now imported at module level
-
-    # Get transformers first, as they might be needed for client E/N
-    transformer_to_latlon, _, err_msg_transformer = get_transformers(
-        target_crs_epsg_str
-    )
-    if err_msg_transformer:
-        # err_msg_transformer is already user-friendly from get_transformers
-        return None, (jsonify({
-            "status": "error", "message": err_msg_transformer
-        }), 400)
-
-    ref_pts_list, csv_err_msg = load_reference_points()
-    if csv_err_msg:
-        # csv_err_msg is already a user-friendly message
-        current_app.logger.error(
-            f"Error loading reference points for {export_format_name}: {csv_err_msg}"
-        )
-        return None, (jsonify({
-            "status": "error",
-            "message": f"Failed to load reference points: {csv_err_msg}"
-        }), 500)
-
     main_ref_e_client = request_data.get('main_ref_e')
     main_ref_n_client = request_data.get('main_ref_n')
-    main_ref_e = None
-    main_ref_n = None
-    main_ref_transformed_lonlat = None
-    using_client_ref_coords = False
+    # current_app is now imported at module level
 
-    if main_ref_e_client is not None and main_ref_n_client is not None:
-        try:
-            main_ref_e = float(main_ref_e_client)
-            main_ref_n = float(main_ref_n_client)
-            if transformer_to_latlon: # Ensure transformer is available
-                # pyproj always_xy=True means transform expects (x, y) -> (lon, lat) for projected to geographic
-                main_ref_transformed_lonlat = transformer_to_latlon.transform(main_ref_e, main_ref_n)
-            using_client_ref_coords = True
-            current_app.logger.info(
-                f"Export ({export_format_name}): Using client-provided reference: E {main_ref_e}, N {main_ref_n}"
-            )
-        except ValueError:
-            current_app.logger.warning(
-                f"Export ({export_format_name}): Could not parse client main_ref_e ('{main_ref_e_client}') or "
-                f"main_ref_n ('{main_ref_n_client}') as float. Falling back to selected reference point name."
-            )
-            main_ref_e = None # Ensure fallback
-            main_ref_n = None # Ensure fallback
-            using_client_ref_coords = False # Explicitly set for clarity
-        except Exception as e_tx: # Catch transformation errors for client coords
-            current_app.logger.error(
-                f"Export ({export_format_name}): Error transforming client-provided E {main_ref_e_client}, "
-                f"N {main_ref_n_client} to Lat/Lon: {str(e_tx)}", exc_info=True
-            )
-            # main_ref_transformed_lonlat remains None. If E/N were valid, they can still be used for projected exports.
-            # The calling export function must handle None for main_ref_transformed_lonlat if it needs it.
-            using_client_ref_coords = True # Still true because we used client E/N, even if transform failed.
+    # Reject a payload with nothing to export before any CRS or CSV work.
+    # (Client coordinates that turn out to be unparsable are caught below.)
+    has_client_ref_coords = main_ref_e_client is not None and main_ref_n_client is not None
+    if not has_client_ref_coords and not selected_display_name and not lots_data_from_payload:
+        return None, _nothing_to_export_response(export_format_name)
 
-    if not using_client_ref_coords and selected_display_name:
-        selected_point_details = next(
-            (p for p in ref_pts_list if p['display_name'] == selected_display_name),
-            None
-        )
-        if not selected_point_details:
-            msg = (
-                f"The selected reference point '{selected_display_name}' "
-                f"could not be found. Please check your selection."
-            )
-            return None, (jsonify({"status": "error", "message": msg}), 400)
-        try:
-            main_ref_e = float(selected_point_details['EASTINGS'])
-            main_ref_n = float(selected_point_details['NORTHINGS'])
-            current_app.logger.info(
-                f"Export ({export_format_name}): Using reference from CSV '{selected_display_name}': E {main_ref_e}, N {main_ref_n}"
-            )
-            if transformer_to_latlon:
-                main_ref_transformed_lonlat = transformer_to_latlon.transform(
-                    main_ref_e, main_ref_n
-                )
-        except ValueError:
-            msg = (
-                f"The coordinates for the selected reference point '{selected_display_name}' "
-                f"in the reference data are invalid. Please check the CSV file."
-            )
-            current_app.logger.error(
-                f"Export ({export_format_name}): ValueError for reference point '{selected_display_name}' coordinates: "
-                f"E='{selected_point_details.get('EASTINGS', 'N/A')}', "
-                f"N='{selected_point_details.get('NORTHINGS', 'N/A')}'"
-            )
-            return None, (jsonify({"status": "error", "message": msg}), 400)
-        except Exception as e_tx:
-            current_app.logger.error(
-                f"Export ({export_format_name}): Error transforming CSV ref point "
-                f"'{selected_display_name}' (E:{main_ref_e}, N:{main_ref_n}) to Lat/Lon: {str(e_tx)}", exc_info=True
-            )
-            # main_ref_transformed_lonlat remains None.
+    # Get transformers first, as they might be needed for client E/N
+    transformer_to_latlon, err_msg_transformer = get_transformer_to_latlon(
+        target_crs_epsg_str
+    )
+    if err_msg_transformer:
+        # err_msg_transformer is already user-friendly from get_transformer_to_latlon
+        return None, (jsonify({
+            "status": "error", "message": err_msg_transformer
+        }), 400)
+
+    main_reference, error_response_tuple = _resolve_main_reference(
+        request_data, transformer_to_latlon, f"Export ({export_format_name}): "
+    )
+    if error_response_tuple:
+        return None, error_response_tuple
+    main_ref_e = main_reference["main_ref_e"]
+    main_ref_n = main_reference["main_ref_n"]
+    main_ref_transformed_lonlat = main_reference["main_ref_transformed_lonlat"]
+    using_client_ref_coords = main_reference["using_client_ref_coords"]
 
     # Critical check for reference point if lots with actual survey lines are present
     if main_ref_e is None or main_ref_n is None:
-        has_lot_lines = any(
-            isinstance(lot, dict) and lot.get('lines_text', '').strip() 
+        has_lot_lines = isinstance(lots_data_from_payload, list) and any(
+            isinstance(lot, dict) and isinstance(lot.get('lines_text'), str) and
+            lot['lines_text'].strip()
             for lot in lots_data_from_payload
         )
         if has_lot_lines:
@@ -965,16 +1503,11 @@ def _prepare_export_data_for_routes(request_data, export_format_name):
     # Check if there's anything to export at all
     # (no client coords, no selected name, and no lot data)
     if not using_client_ref_coords and not selected_display_name and not lots_data_from_payload:
-        msg = (
-            f"No reference point selected or client-provided, and no lot data "
-            f"provided. Please select a reference point or add lot details to "
-            f"export for {export_format_name}."
-        )
-        return None, (jsonify({"status": "error", "message": msg}), 400)
+        return None, _nothing_to_export_response(export_format_name)
 
 
     params = {
-        "transformer_to_latlon": transformer_to_latlon, # May be None if get_transformers failed earlier
+        "transformer_to_latlon": transformer_to_latlon, # May be None if get_transformer_to_latlon failed earlier
         "main_ref_e": main_ref_e,
         "main_ref_n": main_ref_n,
         "main_ref_transformed_lonlat": main_ref_transformed_lonlat,
@@ -1009,6 +1542,10 @@ def _process_lots_for_export(
     Processes a list of lot data by calculating their geometry and then
     calling a format-specific handler for each lot.
 
+    All lots are validated first and their geometry is then calculated in a
+    single batch (see _calculate_lots_geometry); the handler is still called
+    once per lot, in payload order.
+
     Args:
         lots_data_payload (list): List of lot data dictionaries from the request.
         transformer_to_latlon: Transformer for coordinate conversion.
@@ -1027,77 +1564,81 @@ def _process_lots_for_export(
     any_lot_data_processed_successfully = False
     if not isinstance(lots_data_payload, list):
         current_app.logger.error(
-            f"{export_format_name_logging}: Invalid payload structure: 'lots' "
-            f"field is not a list. Payload: {lots_data_payload}"
+            "%s: Invalid payload structure: 'lots' field is not a list. Payload: %s",
+            export_format_name_logging, lots_data_payload
         )
         return False # No lots processed
 
     if not lots_data_payload:
         return False # No lots to process
 
-    # This check is important if lots are present.
-    # Should not happen if _prepare_export_data_for_routes enforces ref point.
+    # _prepare_export_data_for_routes only requires a reference point when a
+    # lot has survey lines, so lots without any can still reach this point.
     if main_ref_e is None or main_ref_n is None:
         current_app.logger.error(
-            f"{export_format_name_logging}: Critical - main reference E/N missing "
-            f"for lot processing. Lots cannot be processed."
+            "%s: Critical - main reference E/N missing for lot processing. "
+            "Lots cannot be processed.", export_format_name_logging
         )
         return False
 
+    # Pass 1: validate every lot, queueing handler calls in payload order.
+    # Entries are (lot_id, lot_name, error_result) for KMZ error markers, or
+    # (lot_id, lot_name, None) for lots whose geometry is calculated below.
+    handler_queue = []
+    lot_specs = []
+    # KMZ specific: malformed lots get an error marker instead of being dropped.
+    wants_error_markers = bool(
+        hasattr(export_specific_context, 'get') and
+        export_specific_context.get('kml_writer')
+    )
     for index, lot_input in enumerate(lots_data_payload):
         if not isinstance(lot_input, dict):
             current_app.logger.warning(
-                f"{export_format_name_logging}: Skipping malformed lot entry at "
-                f"index {index}: not a dictionary. Entry: {lot_input}"
+                "%s: Skipping malformed lot entry at index %d: not a dictionary. "
+                "Entry: %s", export_format_name_logging, index, lot_input
             )
-            # KMZ specific: call handler to create an error marker.
-            if (hasattr(export_specific_context, 'get') and
-                    export_specific_context.get('project_folder')):
-                lot_data_handler_callback(
+            if wants_error_markers:
+                handler_queue.append((
                     f"malformed_lot_{index}", f"Malformed Lot {index+1}", 
                     {"status": "error",
-                     "message": "Lot data is not structured correctly (must be a dictionary)."}, 
-                    export_specific_context
-                )
+                     "message": "Lot data is not structured correctly (must be a dictionary)."}
+                ))
             continue
 
         lot_id = lot_input.get('id')
         if lot_id is None:
             lot_id = f"missing_id_{index}"
             current_app.logger.warning(
-                f"{export_format_name_logging}: Lot entry at index {index} is "
-                f"missing 'id'. Using default: '{lot_id}'."
+                "%s: Lot entry at index %d is missing 'id'. Using default: '%s'.",
+                export_format_name_logging, index, lot_id
             )
 
         lot_name = lot_input.get('name')
         if lot_name is None:
             lot_name = f"Unnamed Lot {index+1}"
             current_app.logger.warning(
-                f"{export_format_name_logging}: Lot entry '{lot_id}' is missing "
-                f"'name'. Using default: '{lot_name}'."
+                "%s: Lot entry '%s' is missing 'name'. Using default: '%s'.",
+                export_format_name_logging, lot_id, lot_name
             )
         
         lines_text = lot_input.get('lines_text')
         if not isinstance(lines_text, str):
             current_app.logger.warning(
-                f"{export_format_name_logging}: Skipping lot '{lot_id}' ({lot_name}): "
-                f"'lines_text' is missing or not a string. Entry: {lot_input}"
+                "%s: Skipping lot '%s' (%s): 'lines_text' is missing or not a "
+                "string. Entry: %s", export_format_name_logging, lot_id, lot_name, lot_input
             )
-            # KMZ specific: call handler to create an error marker.
-            if (hasattr(export_specific_context, 'get') and
-                    export_specific_context.get('project_folder')):
-                lot_data_handler_callback(
+            if wants_error_markers:
+                handler_queue.append((
                     lot_id, lot_name, 
                     {"status": "error",
-                     "message": "Lot survey lines ('lines_text') are missing or invalid."},
-                    export_specific_context
-                )
+                     "message": "Lot survey lines ('lines_text') are missing or invalid."}
+                ))
             continue
 
         if not lines_text.strip():  # Handles empty string for lines_text
             current_app.logger.info(
-                f"{export_format_name_logging}: Skipping empty Lot '{lot_name}' "
-                f"(ID: {lot_id}) as 'lines_text' is blank."
+                "%s: Skipping empty Lot '%s' (ID: %s) as 'lines_text' is blank.",
+                export_format_name_logging, lot_name, lot_id
             )
             # Call handler for empty lot if it needs to do something (e.g. log specific error marker)
             # For now, we assume the callback is for non-empty, calculated lots.
@@ -1107,9 +1648,16 @@ def _process_lots_for_export(
             #                          export_specific_context)
             continue
 
-        single_lot_geometry_result = _calculate_single_lot_geometry(
-            transformer_to_latlon, main_ref_e, main_ref_n, lines_text, lot_id, lot_name
-        )
+        handler_queue.append((lot_id, lot_name, None))
+        lot_specs.append((lines_text, lot_id, lot_name))
+
+    # Pass 2: calculate all queued lots in one batch (one lat/lon transform)
+    lot_geometry_results = iter(_calculate_lots_geometry(
+        transformer_to_latlon, main_ref_e, main_ref_n, lot_specs
+    ) if lot_specs else [])
+
+    for lot_id, lot_name, error_result in handler_queue:
+        single_lot_geometry_result = error_result or next(lot_geometry_results)
         
         # The callback returns true if it successfully "handled" the lot (e.g. added geometry or an error marker)
         # We specifically track if any *successful geometric data* was generated.
@@ -1119,21 +1667,163 @@ def _process_lots_for_export(
             
     return any_lot_data_processed_successfully
 
+
+# --- Export Output Helpers ---
+
+# Export archives are built in spooled temporary files: they stay in memory
+# up to this size and transparently move to disk beyond it, so a very large
+# export does not hold its whole output (plus intermediates) in RAM.
+EXPORT_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+# gzip level for streamed text exports; JSON compresses well even at the
+# fastest level, and the saving is on the wire rather than in CPU.
+EXPORT_GZIP_LEVEL = 1
+# Block size used when a finished export spool is streamed through gzip.
+EXPORT_SPOOL_READ_BYTES = 64 * 1024
+
+
+def _new_export_spool():
+    """Returns an empty binary SpooledTemporaryFile for building an export."""
+    return tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES, mode='w+b')
+
+
+def _send_export_spool(spool, download_filename, mimetype, compress=False):
+    """
+    Sends a finished export spool as a file download.
+
+    send_file() can only size BytesIO objects itself, so the length is taken
+    from the spool and set on the response. The spool is closed (and any
+    spilled file removed) once the response has been sent.
+
+    Args:
+        spool (tempfile.SpooledTemporaryFile): The written export.
+        download_filename (str): File name offered to the client.
+        mimetype (str): Response MIME type.
+        compress (bool): Stream the spool with Content-Encoding: gzip when the
+                         client's Accept-Encoding allows it (for text formats;
+                         archives are already compressed).
+
+    Returns:
+        flask.Response: The download response.
+    """
+    spool.seek(0)
+    if compress and request.accept_encodings.quality("gzip") > 0:
+        return _stream_export_download(
+            _iter_spool_chunks(spool), download_filename, mimetype, compress=True
+        )
+    size = spool.seek(0, os.SEEK_END)
+    spool.seek(0)
+    response = send_file(spool, download_name=download_filename, as_attachment=True, mimetype=mimetype)
+    response.content_length = size
+    if compress:
+        response.vary.add("Accept-Encoding")
+    return response
+
+
+def _iter_spool_chunks(spool):
+    """
+    Reads an export spool in blocks, closing it once it is exhausted or the
+    response is closed early.
+
+    Args:
+        spool (tempfile.SpooledTemporaryFile): The written export, rewound.
+
+    Yields:
+        bytes: Consecutive blocks of at most EXPORT_SPOOL_READ_BYTES.
+    """
+    try:
+        while True:
+            block = spool.read(EXPORT_SPOOL_READ_BYTES)
+            if not block:
+                break
+            yield block
+    finally:
+        spool.close()
+
+
+def _gzip_chunks(chunks):
+    """
+    Gzip-compresses a stream of bytes chunks on the fly.
+
+    Args:
+        chunks (iterable): Bytes chunks to compress.
+
+    Yields:
+        bytes: Consecutive pieces of one gzip member.
+    """
+    compressor = zlib.compressobj(EXPORT_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _stream_export_download(chunks, download_filename, mimetype, compress=False):
+    """
+    Streams an export to the client as a file download.
+
+    Used for text exports that can be serialized piece by piece; the
+    Content-Disposition header is built the same way send_file() does,
+    including the RFC 5987 form for non-ASCII file names.
+
+    Args:
+        chunks (iterable): Bytes chunks making up the file.
+        download_filename (str): File name offered to the client.
+        mimetype (str): Response MIME type.
+        compress (bool): Send the body with Content-Encoding: gzip when the
+                         client's Accept-Encoding allows it.
+
+    Returns:
+        flask.Response: The streamed download response.
+    """
+    try:
+        download_filename.encode("ascii")
+        names = {"filename": download_filename}
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", download_filename)
+        simple = simple.encode("ascii", "ignore").decode("ascii")
+        quoted = quote(download_filename, safe="!#$&+-.^_`|~")
+        names = {"filename": simple, "filename*": f"UTF-8''{quoted}"}
+    use_gzip = compress and request.accept_encodings.quality("gzip") > 0
+    response = Response(_gzip_chunks(chunks) if use_gzip else chunks, mimetype=mimetype)
+    response.headers.set("Content-Disposition", "attachment", **names)
+    if compress:
+        response.vary.add("Accept-Encoding")
+    if use_gzip:
+        response.content_encoding = "gzip"
+    response.cache_control.no_cache = True
+    return response
+
+
 # --- Shapefile Specific Lot Handler ---
 
+# Output layers, in the order they are written to the archive.
+SHAPEFILE_LAYER_NAMES = (
+    "main_reference_monument", "all_points_of_beginning", "all_tie_lines",
+    "all_parcel_polygons", "all_parcel_linestrings",
+)
+# Archive members written without compression (binary geometry/index parts).
+SHAPEFILE_STORED_EXTENSIONS = (".shp", ".shx")
+# Numeric attribute fields and the decimals they are written with.
+SHAPEFILE_NUMERIC_FIELD_DECIMALS = {
+    "Easting": 3, "Northing": 3, "Length_m": 2, "Area_sqm": 2, "Perim_m": 2,
+}
+
 
 def _shapefile_lot_handler(lot_id, lot_name, geometry_result, context):
     """
     Handles a single lot's geometry data for Shapefile export.
 
-    Adds geometries (POB, tie-line, parcel) to the appropriate lists in the
-    `gdfs` dictionary within the `context`.
+    Queues the lot's POB, tie-line and parcel coordinates in the `context`
+    for bulk geometry construction once all lots have been handled.
 
     Args:
         lot_id (str): The ID of the lot.
         lot_name (str): The name of the lot.
-        geometry_result (dict): The result from _calculate_single_lot_geometry.
-        context (dict): Context dictionary containing 'gdfs' and 'target_crs_epsg_int'.
+        geometry_result (dict): A lot result from _calculate_lots_geometry.
+        context (dict): Context dictionary containing the 'pob_points',
+                        'tie_lines' and 'parcels' lists that this handler
+                        appends (lot_name, coords, ...) entries to.
 
     Returns:
         bool: True if data was successfully added for this lot, False otherwise.
@@ -1141,67 +1831,194 @@ def _shapefile_lot_handler(lot_id, lot_name, geometry_result, context):
     if geometry_result["status"] != "success":
         # Message from geometry_result is already quite specific for this lot.
         current_app.logger.error(
-            f"Shapefile: Cannot export Lot '{lot_name}': {geometry_result.get('message')}"
+            "Shapefile: Cannot export Lot '%s': %s", lot_name, geometry_result.get('message')
         )
         return False # Did not add data
 
-    gdfs = context['gdfs']
-    # target_crs_epsg_int = context['target_crs_epsg_int'] # CRS is set when GDF is created
+    # Only raw coordinates are captured here; the geometries of all lots are
+    # built in bulk afterwards by _add_lot_geometries_to_gdfs.
     lot_proj_data = geometry_result["projected"]
     data_added = False
 
     if lot_proj_data.get("pob_en"):
-        pob_e, pob_n = lot_proj_data["pob_en"]
-        gdfs["all_points_of_beginning_geom"].append(Point(pob_e, pob_n))
-        gdfs["all_points_of_beginning_attrs"].append({"LotName": lot_name, "Type": "POB", "Easting": f"{pob_e:.3f}", "Northing": f"{pob_n:.3f}"})
+        context['pob_points'].append((lot_name, lot_proj_data["pob_en"]))
         data_added = True
 
     if lot_proj_data.get("tie_line_ens") and len(lot_proj_data["tie_line_ens"]) == 2:
-        try:
-            tie_line_geom = LineString(lot_proj_data["tie_line_ens"])
-            gdfs["all_tie_lines_geom"].append(tie_line_geom)
-            gdfs["all_tie_lines_attrs"].append({"LotName": lot_name, "Length_m": f"{tie_line_geom.length:.2f}"})
-            data_added = True
-        except Exception as e: current_app.logger.error(f"Shapefile: Error creating Tie-Line GDF for Lot '{lot_name}': {str(e)}", exc_info=True)
+        context['tie_lines'].append((lot_name, lot_proj_data["tie_line_ens"]))
+        data_added = True
     
     parcel_ens = lot_proj_data.get("parcel_boundary_ens", [])
     if len(parcel_ens) >= 3: # Need at least 3 points for a polygon or meaningful linestring
-        is_closed_polygon = len(parcel_ens) >= 4 and parcel_ens[0] == parcel_ens[-1]
-        if is_closed_polygon:
-            try:
-                poly_geom = Polygon(parcel_ens)
-                if poly_geom.is_valid and not poly_geom.is_empty:
-                    gdfs["all_parcel_polygons_geom"].append(poly_geom)
-                    gdfs["all_parcel_polygons_attrs"].append({"LotName": lot_name, "Area_sqm": f"{poly_geom.area:.2f}", "Perim_m": f"{poly_geom.length:.2f}"})
-                    data_added = True
-                else: 
-                    gdfs["all_parcel_linestrings_geom"].append(LineString(parcel_ens)) # Fallback for invalid polygon
-                    gdfs["all_parcel_linestrings_attrs"].append({"LotName": lot_name, "Type": "Invalid Polygon"})
-                    data_added = True
-            except Exception as e: current_app.logger.error(f"Shapefile: Error creating Parcel Polygon GDF for Lot '{lot_name}': {str(e)}", exc_info=True)
-        elif len(parcel_ens) > 1 : # Open linestring
-            try:
-                gdfs["all_parcel_linestrings_geom"].append(LineString(parcel_ens))
-                gdfs["all_parcel_linestrings_attrs"].append({"LotName": lot_name, "Type": "Open Lines"})
-                data_added = True
-            except Exception as e: current_app.logger.error(f"Shapefile: Error creating Parcel LineString GDF for Lot '{lot_name}': {str(e)}", exc_info=True)
+        is_closed_polygon = len(parcel_ens) >= 4 and lot_proj_data["is_closed"]
+        if is_closed_polygon or len(parcel_ens) > 1: # Polygon, or open linestring
+            context['parcels'].append((lot_name, geometry_result["parcel_ring_ens"], is_closed_polygon))
+            data_added = True
     return data_added
 
+
+def _ragged_coords(coord_lists):
+    """
+    Packs several coordinate sequences into the flat arrays shapely's bulk
+    constructors take.
+
+    Args:
+        coord_lists (list): (N, 2) arrays or sequences of (E, N) tuples, one
+                            per geometry.
+
+    Returns:
+        tuple: (coords, indices) where 'coords' is an (N, 2) float64 array of
+               all coordinates and 'indices' gives each row's geometry index.
+    """
+    coords = np.concatenate(
+        [np.asarray(coord_list, dtype=np.float64) for coord_list in coord_lists]
+    )
+    indices = np.repeat(
+        np.arange(len(coord_lists)), [len(coord_list) for coord_list in coord_lists]
+    )
+    return coords, indices
+
+
+def _shapefile_attr_columns(attrs):
+    """
+    Turns an accumulated Shapefile attribute table into GeoDataFrame columns.
+
+    Numeric fields are gathered as float64 array chunks while the lots are
+    processed; they are joined here and formatted to the fixed number of
+    decimals listed in SHAPEFILE_NUMERIC_FIELD_DECIMALS, so the DBF keeps its
+    text fields. Other fields are passed through unchanged.
+
+    Args:
+        attrs (dict): Field name -> list of values (or of float64 chunks for
+                      numeric fields).
+
+    Returns:
+        dict: Field name -> list of values, ready for gpd.GeoDataFrame.
+    """
+    columns = {}
+    for field_name, values in attrs.items():
+        decimals = SHAPEFILE_NUMERIC_FIELD_DECIMALS.get(field_name)
+        if decimals is None:
+            columns[field_name] = values
+            continue
+        field_values = np.concatenate(values) if values else np.empty(0, dtype=np.float64)
+        columns[field_name] = [f"{value:.{decimals}f}" for value in field_values.tolist()]
+    return columns
+
+
+def _add_lot_geometries_to_gdfs(context):
+    """
+    Builds the geometries of all handled lots in bulk for Shapefile export.
+
+    POB points and tie-lines are created with shapely's vectorized
+    constructors (one GEOS call per layer rather than one Python object per
+    lot) and appended, with their attributes, to the `gdfs` accumulator.
+    Parcels are handed to _add_parcel_geometries_to_gdfs.
+
+    Args:
+        context (dict): The Shapefile processing context filled by
+                        _shapefile_lot_handler.
+    """
+    gdfs = context['gdfs']
+
+    pob_points = context['pob_points']
+    if pob_points:
+        pob_coords = np.array([pob_en for _, pob_en in pob_points], dtype=np.float64)
+        gdfs["all_points_of_beginning_geom"].extend(shapely.points(pob_coords))
+        pob_attrs = gdfs["all_points_of_beginning_attrs"]
+        pob_attrs["LotName"].extend(lot_name for lot_name, _ in pob_points)
+        pob_attrs["Type"].extend(["POB"] * len(pob_points))
+        pob_attrs["Easting"].append(pob_coords[:, 0])
+        pob_attrs["Northing"].append(pob_coords[:, 1])
+
+    tie_lines = context['tie_lines']
+    if tie_lines:
+        try:
+            tie_coords, tie_indices = _ragged_coords([tie_ens for _, tie_ens in tie_lines])
+            tie_line_geoms = shapely.linestrings(tie_coords, indices=tie_indices)
+            tie_line_lengths = shapely.length(tie_line_geoms)
+            gdfs["all_tie_lines_geom"].extend(tie_line_geoms)
+            tie_attrs = gdfs["all_tie_lines_attrs"]
+            tie_attrs["LotName"].extend(lot_name for lot_name, _ in tie_lines)
+            tie_attrs["Length_m"].append(tie_line_lengths)
+        except Exception as e: current_app.logger.error(f"Shapefile: Error creating Tie-Line GDF for {len(tie_lines)} lot(s): {str(e)}", exc_info=True)
+
+    _add_parcel_geometries_to_gdfs(context['parcels'], gdfs)
+
+
+def _add_parcel_geometries_to_gdfs(parcels, gdfs):
+    """
+    Builds the parcel geometries of all lots in bulk for Shapefile export.
+
+    Closed rings are packed into a single coordinate array so that GEOS builds
+    every polygon, and computes validity, area and perimeter, in vectorized
+    calls instead of one Polygon per lot. Open parcels, and closed rings that
+    do not form a valid polygon, become LineStrings built in one further
+    call. Both layers keep the lots' payload order.
+
+    Args:
+        parcels (list): (lot_name, parcel_ring_ens, is_closed_polygon)
+                        tuples, in lot order.
+        gdfs (dict): The Shapefile GDF accumulator to append to.
+    """
+    if not parcels:
+        return
+    lot_names = np.array([lot_name for lot_name, _, _ in parcels], dtype=object)
+    is_closed = np.array([is_closed_polygon for _, _, is_closed_polygon in parcels], dtype=bool)
+    is_polygon = np.zeros(len(parcels), dtype=bool)  # Closed and valid
+    is_dropped = np.zeros(len(parcels), dtype=bool)  # Closed, but the polygon batch failed
+
+    if is_closed.any():
+        closed_positions = np.flatnonzero(is_closed)
+        try:
+            ring_coords, ring_indices = _ragged_coords([parcels[i][1] for i in closed_positions])
+            polygons = shapely.polygons(shapely.linearrings(ring_coords, indices=ring_indices))
+            usable = shapely.is_valid(polygons) & ~shapely.is_empty(polygons)
+            is_polygon[closed_positions] = usable
+
+            gdfs["all_parcel_polygons_geom"].extend(polygons[usable])
+            polygon_attrs = gdfs["all_parcel_polygons_attrs"]
+            polygon_attrs["LotName"].extend(lot_names[closed_positions[usable]].tolist())
+            polygon_attrs["Area_sqm"].append(shapely.area(polygons[usable]))
+            polygon_attrs["Perim_m"].append(shapely.length(polygons[usable]))
+        except Exception as e:
+            current_app.logger.error(
+                f"Shapefile: Error creating Parcel Polygon GDF for {len(closed_positions)} lot(s): {str(e)}",
+                exc_info=True
+            )
+            is_dropped = is_closed & ~is_polygon
+
+    # Open lines, plus the fallback for closed rings that are not valid polygons
+    line_parcels = [parcels[i] for i in np.flatnonzero(~is_polygon & ~is_dropped)]
+
+    if line_parcels:
+        try:
+            line_coords, line_indices = _ragged_coords([parcel_ens for _, parcel_ens, _ in line_parcels])
+            gdfs["all_parcel_linestrings_geom"].extend(shapely.linestrings(line_coords, indices=line_indices))
+            line_attrs = gdfs["all_parcel_linestrings_attrs"]
+            line_attrs["LotName"].extend(lot_name for lot_name, _, _ in line_parcels)
+            line_attrs["Type"].extend(
+                "Invalid Polygon" if is_closed_polygon else "Open Lines"
+                for _, _, is_closed_polygon in line_parcels
+            )
+        except Exception as e: current_app.logger.error(f"Shapefile: Error creating Parcel LineString GDF for {len(line_parcels)} lot(s): {str(e)}", exc_info=True)
+
 @app.route('/export_shapefile_multi', methods=['POST'])
 @limiter.limit("5 per minute;20 per hour")
 def export_shapefile_multi():
     """Exports survey data for multiple lots as a zipped collection of Shapefiles."""
+    import geopandas as gpd  # Deferred: only needed for Shapefile export
     # current_app is now imported at module level
     request_json_data = request.get_json()
     if not request_json_data:
         return jsonify({"status": "error", "message": "No JSON data provided."}), 400
 
-    export_params, error_response_tuple = _prepare_export_data_for_routes(
+    export_params, error_response_tuple = _prepare_export_data_cached(
         request_json_data, "Shapefile"
     )
     if error_response_tuple:
         # error_response_tuple is (None, (jsonify_object, status_code))
-        return error_response_tuple[1]
+        return error_response_tuple
     # No JSON data provided. (Handled by initial check)
     # Error from _prepare_export_data_for_routes (Handled by error_response_tuple)
 
@@ -1212,26 +2029,38 @@ def export_shapefile_multi():
     selected_display_name = export_params["selected_display_name"]
     target_crs_epsg_int = export_params["target_crs_epsg_int"] # Already validated int
 
-    # Initialize GDF structures
+    # Initialize GDF structures. Attributes are kept as columns (lists per
+    # field) so they can be filled in bulk and turned into frames directly.
+    # Numeric fields (see SHAPEFILE_NUMERIC_FIELD_DECIMALS) collect float64
+    # array chunks and are only formatted when the frames are built.
     gdfs_data_accumulator = {
-        "main_reference_monument_geom": [], "main_reference_monument_attrs": [],
-        "all_points_of_beginning_geom": [], "all_points_of_beginning_attrs": [],
-        "all_tie_lines_geom": [], "all_tie_lines_attrs": [],
-        "all_parcel_polygons_geom": [], "all_parcel_polygons_attrs": [],
-        "all_parcel_linestrings_geom": [], "all_parcel_linestrings_attrs": []
+        "main_reference_monument_geom": [],
+        "main_reference_monument_attrs": {"Name": [], "Type": [], "Easting": [], "Northing": []},
+        "all_points_of_beginning_geom": [],
+        "all_points_of_beginning_attrs": {"LotName": [], "Type": [], "Easting": [], "Northing": []},
+        "all_tie_lines_geom": [],
+        "all_tie_lines_attrs": {"LotName": [], "Length_m": []},
+        "all_parcel_polygons_geom": [],
+        "all_parcel_polygons_attrs": {"LotName": [], "Area_sqm": [], "Perim_m": []},
+        "all_parcel_linestrings_geom": [],
+        "all_parcel_linestrings_attrs": {"LotName": [], "Type": []}
     }
     
     has_main_ref_data = False
     if main_ref_e is not None and main_ref_n is not None:
         gdfs_data_accumulator["main_reference_monument_geom"].append(Point(main_ref_e, main_ref_n))
-        gdfs_data_accumulator["main_reference_monument_attrs"].append({
-            "Name": "Reference Monument", "Type": "REF_MON", 
-            "Easting": f"{main_ref_e:.3f}", "Northing": f"{main_ref_n:.3f}"
-        })
+        ref_monument_attrs = gdfs_data_accumulator["main_reference_monument_attrs"]
+        ref_monument_attrs["Name"].append("Reference Monument")
+        ref_monument_attrs["Type"].append("REF_MON")
+        ref_monument_attrs["Easting"].append(np.array([main_ref_e], dtype=np.float64))
+        ref_monument_attrs["Northing"].append(np.array([main_ref_n], dtype=np.float64))
         has_main_ref_data = True
 
     shapefile_processing_context = {
         'gdfs': gdfs_data_accumulator,
+        'pob_points': [],
+        'tie_lines': [],
+        'parcels': [],
         'target_crs_epsg_int': target_crs_epsg_int
     }
     
@@ -1239,21 +2068,19 @@ def export_shapefile_multi():
         lots_data_from_payload, transformer_to_latlon, main_ref_e, main_ref_n,
         _shapefile_lot_handler, shapefile_processing_context, "Shapefile"
     )
+    _add_lot_geometries_to_gdfs(shapefile_processing_context)
 
     if not has_main_ref_data and not has_valid_lot_data_for_export:
          return jsonify({"status": "error", "message": "No valid reference point or lot geometric data available to export for Shapefile."}), 400
 
     final_gdfs = {}
-    if gdfs_data_accumulator["main_reference_monument_geom"]:
-        final_gdfs["main_reference_monument"] = gpd.GeoDataFrame(gdfs_data_accumulator["main_reference_monument_attrs"], geometry=gdfs_data_accumulator["main_reference_monument_geom"], crs=f"EPSG:{target_crs_epsg_int}")
-    if gdfs_data_accumulator["all_points_of_beginning_geom"]:
-        final_gdfs["all_points_of_beginning"] = gpd.GeoDataFrame(gdfs_data_accumulator["all_points_of_beginning_attrs"], geometry=gdfs_data_accumulator["all_points_of_beginning_geom"], crs=f"EPSG:{target_crs_epsg_int}")
-    if gdfs_data_accumulator["all_tie_lines_geom"]:
-        final_gdfs["all_tie_lines"] = gpd.GeoDataFrame(gdfs_data_accumulator["all_tie_lines_attrs"], geometry=gdfs_data_accumulator["all_tie_lines_geom"], crs=f"EPSG:{target_crs_epsg_int}")
-    if gdfs_data_accumulator["all_parcel_polygons_geom"]:
-        final_gdfs["all_parcel_polygons"] = gpd.GeoDataFrame(gdfs_data_accumulator["all_parcel_polygons_attrs"], geometry=gdfs_data_accumulator["all_parcel_polygons_geom"], crs=f"EPSG:{target_crs_epsg_int}")
-    if gdfs_data_accumulator["all_parcel_linestrings_geom"]:
-        final_gdfs["all_parcel_linestrings"] = gpd.GeoDataFrame(gdfs_data_accumulator["all_parcel_linestrings_attrs"], geometry=gdfs_data_accumulator["all_parcel_linestrings_geom"], crs=f"EPSG:{target_crs_epsg_int}")
+    for layer_name in SHAPEFILE_LAYER_NAMES:
+        layer_geoms = gdfs_data_accumulator[f"{layer_name}_geom"]
+        if layer_geoms:
+            final_gdfs[layer_name] = gpd.GeoDataFrame(
+                _shapefile_attr_columns(gdfs_data_accumulator[f"{layer_name}_attrs"]),
+                geometry=layer_geoms, crs=f"EPSG:{target_crs_epsg_int}"
+            )
 
     if not final_gdfs: # If after accumulation, no GDFs were populated
         return jsonify({"status": "error", "message": "No geometric data could be generated for Shapefile export (possibly all lots had errors or were empty)."}), 400
@@ -1264,58 +2091,159 @@ def export_shapefile_multi():
             for layer_name, gdf_layer in final_gdfs.items():
                 if not gdf_layer.empty:
                     shp_filename = f"{layer_name}.shp" 
-                    gdf_layer.to_file(os.path.join(tmpdir, shp_filename), driver='ESRI Shapefile', encoding='utf-8')
+                    # pyogrio writes through GDAL's vectorized path (Fiona would
+                    # go feature by feature); pinned so an installed Fiona is
+                    # never picked up instead.
+                    gdf_layer.to_file(os.path.join(tmpdir, shp_filename), driver='ESRI Shapefile', encoding='utf-8', engine='pyogrio')
                     files_written = True
             
             if not files_written: 
                  return jsonify({"status": "error", "message": "No shapefiles were generated (it's possible all lots had errors, were empty, or only an empty reference point was provided)."}), 400
 
-            zip_buffer = io.BytesIO()
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zip_buffer = _new_export_spool()
+            # Coordinate-heavy .shp/.shx parts are stored as-is (deflate buys
+            # little on them); the attribute and metadata parts are deflated
+            # at the fastest level.
+            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
                 for item in os.listdir(tmpdir):
-                    zf.write(os.path.join(tmpdir, item), arcname=item)
-            zip_buffer.seek(0)
+                    if os.path.splitext(item)[1].lower() in SHAPEFILE_STORED_EXTENSIONS:
+                        zf.write(os.path.join(tmpdir, item), arcname=item, compress_type=zipfile.ZIP_STORED)
+                    else:
+                        zf.write(os.path.join(tmpdir, item), arcname=item)
     except Exception as e:
         current_app.logger.error(f"Error during multi-lot Shapefile creation/zipping: {str(e)}", exc_info=True)
         return jsonify({"status": "error", "message": "A server error occurred while generating the Shapefile. Please try again later or contact support."}), 500
     
     filename_base = get_sanitized_filename_base(selected_display_name)
     download_filename = f'{filename_base}_epsg{export_params["target_crs_epsg_str"]}_multi_lot_shapefiles.zip'
-    return send_file(zip_buffer, download_name=download_filename, as_attachment=True, mimetype='application/zip')
+    return _send_export_spool(zip_buffer, download_filename, 'application/zip')
 
 # --- KMZ Specific Lot Handler ---
 
+KML_NAMESPACE = "http://www.opengis.net/kml/2.2"
+KML_ICON_BASE_URL = "http://maps.google.com/mapfiles/kml/paddle/"
+# Shared styles, written once at the top of the document and referenced by
+# id from every Placemark. Icon styles: id -> (icon file, scale).
+KML_ICON_STYLES = {
+    "ref-monument": ("red-stars.png", "1.2"),
+    "error-marker": ("blu-blank.png", "1"),
+    "pob": ("grn-circle.png", "1"),
+    "vertex": ("ylw-diamond.png", "0.8"),
+}
+# Line styles: id -> (line color, line width, polygon fill color or None).
+# KML colors are aabbggrr.
+KML_LINE_STYLES = {
+    "tie-line": ("ff0000ff", "2", None),
+    "parcel-lines": ("ffff0000", "3", None),
+    "parcel-polygon": ("ffff0000", "3", "64ff0000"),
+}
+# Description of point markers: (lat, lon, easting, northing, EPSG code).
+# %-formatting is a little cheaper than f-strings for this per-vertex text.
+KML_POINT_DESCRIPTION = "Lat: %.7f, Lon: %.7f\nEasting: %.3f, Northing: %.3f (EPSG:%s)"
+
+
+def _kml_element(kml, tag, text):
+    """Writes a simple <tag>text</tag> element to the KML writer."""
+    kml.startElement(tag, {})
+    kml.characters(text)
+    kml.endElement(tag)
+
+
+def _kml_write_styles(kml):
+    """Writes the shared KML_ICON_STYLES and KML_LINE_STYLES blocks."""
+    for style_id, (icon_file, scale) in KML_ICON_STYLES.items():
+        kml.startElement("Style", {"id": style_id})
+        kml.startElement("IconStyle", {})
+        _kml_element(kml, "scale", scale)
+        kml.startElement("Icon", {})
+        _kml_element(kml, "href", KML_ICON_BASE_URL + icon_file)
+        kml.endElement("Icon")
+        kml.endElement("IconStyle")
+        kml.endElement("Style")
+    for style_id, (line_color, line_width, fill_color) in KML_LINE_STYLES.items():
+        kml.startElement("Style", {"id": style_id})
+        kml.startElement("LineStyle", {})
+        _kml_element(kml, "color", line_color)
+        _kml_element(kml, "width", line_width)
+        kml.endElement("LineStyle")
+        if fill_color:
+            kml.startElement("PolyStyle", {})
+            _kml_element(kml, "color", fill_color)
+            kml.endElement("PolyStyle")
+        kml.endElement("Style")
+
+
+def _kml_write_placemark(kml, name, style_id, geometry_tag, lonlats, description=None):
+    """
+    Writes one Placemark to the KML writer.
+
+    Args:
+        kml (XMLGenerator): The KML document writer.
+        name (str): Placemark name.
+        style_id (str): Id of a shared style (see KML_ICON_STYLES/KML_LINE_STYLES).
+        geometry_tag (str): "Point", "LineString" or "Polygon". Lines and
+                            polygons are clamped to the ground.
+        lonlats (list): (lon, lat) pairs; the geometry is omitted if empty.
+        description (str, optional): Placemark description.
+    """
+    kml.startElement("Placemark", {})
+    _kml_element(kml, "name", name)
+    if description is not None:
+        _kml_element(kml, "description", description)
+    _kml_element(kml, "styleUrl", f"#{style_id}")
+    if lonlats:
+        coordinates = " ".join(f"{lon},{lat},0.0" for lon, lat in lonlats)
+        kml.startElement(geometry_tag, {})
+        if geometry_tag != "Point":
+            _kml_element(kml, "altitudeMode", "clampToGround")
+        if geometry_tag == "Polygon":
+            kml.startElement("outerBoundaryIs", {})
+            kml.startElement("LinearRing", {})
+            _kml_element(kml, "coordinates", coordinates)
+            kml.endElement("LinearRing")
+            kml.endElement("outerBoundaryIs")
+        else:
+            _kml_element(kml, "coordinates", coordinates)
+        kml.endElement(geometry_tag)
+    kml.endElement("Placemark")
+
 
 def _kmz_lot_handler(lot_id, lot_name, geometry_result, context):
-    """Handles a single lot's geometry data for KMZ export."""
-    project_folder = context['project_folder']
+    """
+    Handles a single lot's geometry data for KMZ export.
+
+    Lots are streamed straight into the KML document held by the context
+    (one Folder per lot, error markers as single Placemarks), in lot order.
+    """
+    kml = context['kml_writer']
     target_crs_epsg_str = context['target_crs_epsg_str']
     main_ref_lon_kml = context.get('main_ref_lon_kml') 
     main_ref_lat_kml = context.get('main_ref_lat_kml')
+    context['feature_count'] += 1
 
     # current_app is now imported at module level
     if geometry_result["status"] != "success":
         current_app.logger.error(
-            f"KMZ: Cannot include Lot '{lot_name}' due to error: "
-            f"{geometry_result.get('message')}"
+            "KMZ: Cannot include Lot '%s' due to error: %s",
+            lot_name, geometry_result.get('message')
         )
-        error_pnt = project_folder.newpoint(name=f"Error: Lot {lot_name}")
-        error_pnt.description = (
-            f"Could not generate geometry for Lot {lot_name}.\n"
-            f"Error: {geometry_result.get('message')}"
-        )
-        
+        error_coords = []
         pob_latlon = geometry_result.get("latlon", {}).get("pob_latlng")
         if pob_latlon:
-             error_pnt.coords = [(pob_latlon[1], pob_latlon[0])]  # lon, lat
+             error_coords = [(pob_latlon[1], pob_latlon[0])]  # lon, lat
         elif main_ref_lon_kml and main_ref_lat_kml:
-             error_pnt.coords = [(main_ref_lon_kml, main_ref_lat_kml)]
-        error_pnt.style.iconstyle.icon.href = (
-            'http://maps.google.com/mapfiles/kml/paddle/blu-blank.png'
+             error_coords = [(main_ref_lon_kml, main_ref_lat_kml)]
+        _kml_write_placemark(
+            kml, f"Error: Lot {lot_name}", "error-marker", "Point", error_coords,
+            description=(
+                f"Could not generate geometry for Lot {lot_name}.\n"
+                f"Error: {geometry_result.get('message')}"
+            )
         )
         return True  # Error marker was added
 
-    lot_kml_folder = project_folder.newfolder(name=lot_name)
+    kml.startElement("Folder", {})
+    _kml_element(kml, "name", lot_name)
     lot_proj_data = geometry_result["projected"]
     lot_latlon_data = geometry_result["latlon"]
     pob_lon_kml, pob_lat_kml = None, None 
@@ -1323,16 +2251,11 @@ def _kmz_lot_handler(lot_id, lot_name, geometry_result, context):
     if lot_latlon_data.get("pob_latlng"):
         pob_lat_kml, pob_lon_kml = lot_latlon_data["pob_latlng"]
         pob_e_desc, pob_n_desc = lot_proj_data["pob_en"]
-        pnt_pob = lot_kml_folder.newpoint(
-            name="POB", coords=[(pob_lon_kml, pob_lat_kml)]
-        )
-        pnt_pob.description = (
-            f"Lat: {pob_lat_kml:.7f}, Lon: {pob_lon_kml:.7f}\n"
-            f"Easting: {pob_e_desc:.3f}, Northing: {pob_n_desc:.3f} "
-            f"(EPSG:{target_crs_epsg_str})"
-        )
-        pnt_pob.style.iconstyle.icon.href = (
-            'http://maps.google.com/mapfiles/kml/paddle/grn-circle.png'
+        _kml_write_placemark(
+            kml, "POB", "pob", "Point", [(pob_lon_kml, pob_lat_kml)],
+            description=KML_POINT_DESCRIPTION % (
+                pob_lat_kml, pob_lon_kml, pob_e_desc, pob_n_desc, target_crs_epsg_str
+            )
         )
     
     if (lot_latlon_data.get("tie_line_latlngs") and 
@@ -1340,85 +2263,83 @@ def _kmz_lot_handler(lot_id, lot_name, geometry_result, context):
         kml_tie_coords = [
             (ll[1], ll[0]) for ll in lot_latlon_data["tie_line_latlngs"]
         ] 
-        ls_tie = lot_kml_folder.newlinestring(name="Tie-Line", coords=kml_tie_coords)
-        ls_tie.style.linestyle.color = simplekml.Color.red
-        ls_tie.style.linestyle.width = 2
-        ls_tie.altitudemode = simplekml.AltitudeMode.clamptoground
+        _kml_write_placemark(kml, "Tie-Line", "tie-line", "LineString", kml_tie_coords)
 
-    parcel_latlng_list = lot_latlon_data.get("parcel_polygon_latlngs", [])
-    parcel_en_list = lot_proj_data.get("parcel_boundary_ens", [])
+    parcel_ring_lonlats = geometry_result.get("parcel_ring_lonlats", np.empty((0, 2)))
     
-    if parcel_latlng_list:
-        vertex_subfolder = lot_kml_folder.newfolder(name="Vertices")
-        points_to_mark_kml_lot = parcel_latlng_list
-        if (len(parcel_latlng_list) > 1 and 
-                parcel_latlng_list[0] == parcel_latlng_list[-1]):
-            points_to_mark_kml_lot = parcel_latlng_list[:-1]
-
-        for i, (v_lat, v_lon) in enumerate(points_to_mark_kml_lot):
-            is_pob_vertex = False
-            if (pob_lon_kml and pob_lat_kml and 
-                    abs(v_lon - pob_lon_kml) < 1e-7 and 
-                    abs(v_lat - pob_lat_kml) < 1e-7):
-                is_pob_vertex = True
-            if is_pob_vertex:
-                continue 
+    if len(parcel_ring_lonlats):
+        kml.startElement("Folder", {})
+        _kml_element(kml, "name", "Vertices")
+        # One list conversion serves both the vertex markers and the boundary
+        kml_parcel_boundary_coords = parcel_ring_lonlats.tolist()
+        vertex_lonlats = parcel_ring_lonlats
+        points_to_mark_kml_lot = kml_parcel_boundary_coords
+        parcel_ring_is_closed = geometry_result["parcel_ring_is_closed"]
+        if len(kml_parcel_boundary_coords) > 1 and parcel_ring_is_closed:
+            vertex_lonlats = parcel_ring_lonlats[:-1]
+            points_to_mark_kml_lot = kml_parcel_boundary_coords[:-1]
+
+        # The POB already has its own marker: skip vertices on top of it
+        is_pob_vertex = np.zeros(len(vertex_lonlats), dtype=bool)
+        if pob_lon_kml and pob_lat_kml:
+            is_pob_vertex = (
+                (np.abs(vertex_lonlats[:, 0] - pob_lon_kml) < 1e-7) &
+                (np.abs(vertex_lonlats[:, 1] - pob_lat_kml) < 1e-7)
+            )
+        vertex_ens = geometry_result["parcel_ring_ens"].tolist()
 
+        for i in np.flatnonzero(~is_pob_vertex).tolist():
+            v_lon, v_lat = points_to_mark_kml_lot[i]
             v_name = f"Vertex {i + 1}"
-            try:
-                v_e_desc, v_n_desc = parcel_en_list[i]
-            except IndexError:
+            if i < len(vertex_ens):
+                v_e_desc, v_n_desc = vertex_ens[i]
+            else:
                 v_e_desc, v_n_desc = "N/A", "N/A"
             
-            pnt_v = vertex_subfolder.newpoint(name=v_name, coords=[(v_lon, v_lat)])
-            pnt_v.description = (
-                f"Lat: {v_lat:.7f}, Lon: {v_lon:.7f}\n"
-                f"Easting: {v_e_desc:.3f}, Northing: {v_n_desc:.3f} "
-                f"(EPSG:{target_crs_epsg_str})"
-            )
-            pnt_v.style.iconstyle.icon.href = (
-                'http://maps.google.com/mapfiles/kml/paddle/ylw-diamond.png'
+            _kml_write_placemark(
+                kml, v_name, "vertex", "Point", [(v_lon, v_lat)],
+                description=KML_POINT_DESCRIPTION % (
+                    v_lat, v_lon, v_e_desc, v_n_desc, target_crs_epsg_str
+                )
             )
-            pnt_v.style.iconstyle.scale = 0.8
+        kml.endElement("Folder")
         
-        kml_parcel_boundary_coords = [(lon, lat) for lat, lon in parcel_latlng_list]
         if len(kml_parcel_boundary_coords) >= 2:
-            is_closed_lot = (len(kml_parcel_boundary_coords) >= 4 and
-                             kml_parcel_boundary_coords[0] == kml_parcel_boundary_coords[-1])
+            is_closed_lot = len(kml_parcel_boundary_coords) >= 4 and parcel_ring_is_closed
             if is_closed_lot:
-                poly = lot_kml_folder.newpolygon(name="Parcel Boundary")
-                poly.outerboundaryis = kml_parcel_boundary_coords
-                poly.style.polystyle.color = simplekml.Color.changealphaint(
-                    100, simplekml.Color.blue
-                ) 
-                poly.style.linestyle.color = simplekml.Color.blue
-                poly.style.linestyle.width = 3
-                poly.altitudemode = simplekml.AltitudeMode.clamptoground
+                _kml_write_placemark(
+                    kml, "Parcel Boundary", "parcel-polygon", "Polygon",
+                    kml_parcel_boundary_coords
+                )
             else:
-                ls_parcel = lot_kml_folder.newlinestring(
-                    name="Parcel Boundary (Lines)",
-                    coords=kml_parcel_boundary_coords
+                _kml_write_placemark(
+                    kml, "Parcel Boundary (Lines)", "parcel-lines", "LineString",
+                    kml_parcel_boundary_coords
                 )
-                ls_parcel.style.linestyle.color = simplekml.Color.blue
-                ls_parcel.style.linestyle.width = 3
-                ls_parcel.altitudemode = simplekml.AltitudeMode.clamptoground
+    kml.endElement("Folder")
     return True  # Data or error marker was added
 
 
 @app.route('/export_kmz_multi', methods=['POST'])
 @limiter.limit("5 per minute;20 per hour")
 def export_kmz_multi():
-    """Exports survey data for multiple lots as a KMZ file."""
+    """
+    Exports survey data for multiple lots as a KMZ file.
+
+    The KML document is streamed into a memory buffer as the lots are
+    handled, with the styles defined once up front, and then zipped as
+    doc.kml.
+    """
     # current_app is now imported at module level
     request_json_data = request.get_json()
     if not request_json_data:
         return jsonify({"status": "error", "message": "No JSON data provided."}), 400
     
-    export_params, error_response_tuple = _prepare_export_data_for_routes(
+    export_params, error_response_tuple = _prepare_export_data_cached(
         request_json_data, "KMZ"
     )
     if error_response_tuple:
-        return error_response_tuple[1]
+        return error_response_tuple
 
     transformer_to_latlon = export_params["transformer_to_latlon"]
     main_ref_e = export_params["main_ref_e"]
@@ -1428,22 +2349,36 @@ def export_kmz_multi():
     selected_display_name = export_params["selected_display_name"]
     target_crs_epsg_str = export_params["target_crs_epsg_str"]
 
-    kml = simplekml.Kml(name=f"Multi-Lot Survey - {selected_display_name or 'Export'}")
-    project_folder = kml.newfolder(name=f"Project Data (EPSG:{target_crs_epsg_str})")
+    # Buffered text layer over the spool: XMLGenerator issues many tiny writes
+    kml_spool = _new_export_spool()
+    kml_text_stream = io.TextIOWrapper(
+        kml_spool, encoding="utf-8", errors="xmlcharrefreplace", newline="\n"
+    )
+    kml = XMLGenerator(kml_text_stream, encoding="utf-8", short_empty_elements=True)
+    kml.startDocument()
+    kml.startElement("kml", {"xmlns": KML_NAMESPACE})
+    kml.startElement("Document", {})
+    _kml_element(kml, "name", f"Multi-Lot Survey - {selected_display_name or 'Export'}")
+    _kml_write_styles(kml)
+    kml.startElement("Folder", {})
+    _kml_element(kml, "name", f"Project Data (EPSG:{target_crs_epsg_str})")
 
     ref_lon_main_kml, ref_lat_main_kml = None, None
     has_main_ref_kml_data = False
     if main_ref_transformed_lonlat and main_ref_e is not None: # Ensure ref point was selected and valid
         ref_lon_main_kml, ref_lat_main_kml = main_ref_transformed_lonlat
-        pnt_main_ref = project_folder.newpoint(name="Reference Monument (Main)", coords=[(ref_lon_main_kml, ref_lat_main_kml)])
-        pnt_main_ref.description = (f"Lat: {ref_lat_main_kml:.7f}, Lon: {ref_lon_main_kml:.7f}\n"
-                                    f"Easting: {main_ref_e:.3f}, Northing: {main_ref_n:.3f} (EPSG:{target_crs_epsg_str})")
-        pnt_main_ref.style.iconstyle.icon.href = 'http://maps.google.com/mapfiles/kml/paddle/red-stars.png' 
-        pnt_main_ref.style.iconstyle.scale = 1.2
+        _kml_write_placemark(
+            kml, "Reference Monument (Main)", "ref-monument", "Point",
+            [(ref_lon_main_kml, ref_lat_main_kml)],
+            description=KML_POINT_DESCRIPTION % (
+                ref_lat_main_kml, ref_lon_main_kml, main_ref_e, main_ref_n, target_crs_epsg_str
+            )
+        )
         has_main_ref_kml_data = True
     
     kmz_processing_context = {
-        'project_folder': project_folder,
+        'kml_writer': kml,
+        'feature_count': 0,  # Lot folders and error markers written
         'target_crs_epsg_str': target_crs_epsg_str,
         'main_ref_lon_kml': ref_lon_main_kml, 
         'main_ref_lat_kml': ref_lat_main_kml
@@ -1455,36 +2390,63 @@ def export_kmz_multi():
     )
     
     if not has_main_ref_kml_data and not has_any_successful_kmz_lot_data: 
-        # Check if any lot handler returned true (even for error points)
-        # The _process_lots_for_export returns based on SUCCESS status.
-        # A more nuanced check might be needed if error points alone are sufficient for KMZ export
-        # For now, assume we need either main ref OR successful lot geometry.
-        # If lots_data_from_payload was empty, has_any_successful_kmz_lot_data is False.
-        # If lots were processed but all failed with no error markers, it's also False.
-        # If lots processed and error markers were added, KMZ handler returns True for those,
-        # but _process_lots_for_export returns based on "success" status of geometry calculation.
-        # A more nuanced check might be needed if error points alone are sufficient for KMZ export
-        # For KMZ, even if lots fail but error markers are added, it might be a valid export.
-        if not project_folder.features: # No features (ref point or lot data/errors) added
+        # _process_lots_for_export returns based on the SUCCESS status of the
+        # geometry calculation, but for KMZ error markers alone are still a
+        # valid export.
+        if not kmz_processing_context['feature_count']: # No features (ref point or lot data/errors) added
+            kml_text_stream.close()
             return jsonify({"status": "error", "message": "No data (including error markers) could be generated for KMZ export."}), 400
 
-    kmz_buffer = io.BytesIO()
+    kmz_buffer = _new_export_spool()
     try:
-        kml.savekmz(kmz_buffer) 
-        kmz_buffer.seek(0)
+        kml.endElement("Folder")
+        kml.endElement("Document")
+        kml.endElement("kml")
+        kml.endDocument()
+        kml_text_stream.flush()
+        kml_spool.seek(0)
+        # Fastest deflate level: the KML is repetitive markup, so level 1
+        # costs only a few percent in size for a fraction of the CPU time.
+        with zipfile.ZipFile(kmz_buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            with zf.open("doc.kml", "w") as kml_member:
+                shutil.copyfileobj(kml_spool, kml_member)
     except Exception as e:
         current_app.logger.error(f"Error during multi-lot KMZ creation: {str(e)}", exc_info=True)
+        kmz_buffer.close()
         return jsonify({"status": "error", "message": "A server error occurred while generating the KMZ file. Please try again later or contact support."}), 500
+    finally:
+        kml_text_stream.close()  # Also discards the KML spool
 
     filename_base = get_sanitized_filename_base(selected_display_name)
     download_filename = f'{filename_base}_epsg{target_crs_epsg_str}_multi_lot_survey.kmz'
-    return send_file(kmz_buffer, download_name=download_filename, as_attachment=True, mimetype='application/vnd.google-earth.kmz')
+    return _send_export_spool(kmz_buffer, download_filename, 'application/vnd.google-earth.kmz')
 
 # --- DXF Specific Lot Handler ---
+def _dxf_text_attribs(layer, height, align):
+    """
+    Builds the dxfattribs shared by every TEXT entity of one kind.
+
+    The alignment flags are resolved once here, so each label is created in a
+    single add_text() call with its 'insert'/'align_point' added, instead of
+    add_text() followed by set_placement().
+
+    Args:
+        layer (str): Target layer name.
+        height (float): Text height.
+        align (ezdxf.enums.TextEntityAlignment): Text alignment (not ALIGNED/FIT).
+
+    Returns:
+        dict: dxfattribs without the placement points.
+    """
+    from ezdxf.enums import MAP_TEXT_ENUM_TO_ALIGN_FLAGS  # Deferred: only needed for DXF export
+    halign, valign = MAP_TEXT_ENUM_TO_ALIGN_FLAGS[align]
+    return {'layer': layer, 'height': height, 'halign': halign, 'valign': valign}
+
+
 def _dxf_lot_handler(lot_id, lot_name, geometry_result, context):
     # current_app is now imported at module level
     if geometry_result["status"] != "success":
-        current_app.logger.error(f"DXF: Cannot include Lot '{lot_name}' due to error: {geometry_result.get('message')}")
+        current_app.logger.error("DXF: Cannot include Lot '%s' due to error: %s", lot_name, geometry_result.get('message'))
         return False
 
     msp = context['msp']
@@ -1496,10 +2458,11 @@ def _dxf_lot_handler(lot_id, lot_name, geometry_result, context):
     if lot_proj_data.get("pob_en"):
         pob_e, pob_n = lot_proj_data["pob_en"]
         msp.add_point((pob_e, pob_n), dxfattribs={'layer': "POB"})
+        pob_label_loc = (pob_e + text_height, pob_n)
         msp.add_text(
             f"POB {lot_name}",
-            dxfattribs={'layer': "LABELS", 'height': text_height * 0.7}
-        ).set_placement((pob_e + text_height, pob_n), align=TextEntityAlignment.BOTTOM_LEFT)
+            dxfattribs={**context['pob_label_attribs'], 'insert': pob_label_loc, 'align_point': pob_label_loc}
+        )
         data_added = True
 
     if lot_proj_data.get("tie_line_ens") and len(lot_proj_data["tie_line_ens"]) == 2:
@@ -1510,15 +2473,16 @@ def _dxf_lot_handler(lot_id, lot_name, geometry_result, context):
     parcel_ens = lot_proj_data.get("parcel_boundary_ens", [])
     if parcel_ens:
         parcel_layer_name = "PARCEL_BOUNDARIES"
-        is_closed = len(parcel_ens) >= 3 and parcel_ens[0] == parcel_ens[-1]
+        is_closed = len(parcel_ens) >= 3 and lot_proj_data["is_closed"]
         msp.add_lwpolyline(parcel_ens, dxfattribs={'layer': parcel_layer_name, 'flags': 1 if is_closed else 0})
         data_added = True
 
         text_loc_e, text_loc_n = lot_proj_data.get("pob_en") or parcel_ens[0]
+        lot_name_loc = (text_loc_e, text_loc_n - text_height * 2)
         msp.add_text(
             lot_name,
-            dxfattribs={'layer': "LOT_NAMES", 'height': text_height}
-        ).set_placement((text_loc_e, text_loc_n - text_height * 2), align=TextEntityAlignment.TOP_CENTER)
+            dxfattribs={**context['lot_name_attribs'], 'insert': lot_name_loc, 'align_point': lot_name_loc}
+        )
     return data_added
 
 @app.route('/export_dxf_multi', methods=['POST'])
@@ -1528,8 +2492,8 @@ def export_dxf_multi():
     request_json_data = request.get_json()
     if not request_json_data: return jsonify({"status": "error", "message": "No JSON data provided."}), 400
 
-    export_params, error_response_tuple = _prepare_export_data_for_routes(request_json_data, "DXF")
-    if error_response_tuple: return error_response_tuple[1]
+    export_params, error_response_tuple = _prepare_export_data_cached(request_json_data, "DXF")
+    if error_response_tuple: return error_response_tuple
 
     transformer_to_latlon = export_params["transformer_to_latlon"] # Not used by DXF entities, but by _calc
     main_ref_e = export_params["main_ref_e"]
@@ -1539,6 +2503,10 @@ def export_dxf_multi():
     target_crs_epsg_str = export_params["target_crs_epsg_str"]
 
     try:
+        # Deferred: only needed for DXF export (ImportError is handled below)
+        import ezdxf
+        from ezdxf.enums import TextEntityAlignment
+
         doc = ezdxf.new('R2010') # Explicitly set encoding if desired: doc.encoding = 'utf-8'
         msp = doc.modelspace()
 
@@ -1559,7 +2527,11 @@ def export_dxf_multi():
             ).set_placement((main_ref_e + text_height, main_ref_n + text_height), align=TextEntityAlignment.MIDDLE_LEFT)
             has_main_ref_dxf_data = True
 
-        dxf_processing_context = {'msp': msp, 'doc': doc, 'text_height': text_height}
+        dxf_processing_context = {
+            'msp': msp, 'doc': doc, 'text_height': text_height,
+            'pob_label_attribs': _dxf_text_attribs("LABELS", text_height * 0.7, TextEntityAlignment.BOTTOM_LEFT),
+            'lot_name_attribs': _dxf_text_attribs("LOT_NAMES", text_height, TextEntityAlignment.TOP_CENTER),
+        }
         has_any_successful_dxf_lot_data = _process_lots_for_export(
             lots_data_from_payload, transformer_to_latlon, main_ref_e, main_ref_n,
             _dxf_lot_handler, dxf_processing_context, "DXF"
@@ -1568,12 +2540,16 @@ def export_dxf_multi():
         if not has_main_ref_dxf_data and not has_any_successful_dxf_lot_data:
             return jsonify({"status": "error", "message": "No valid reference point or lot geometric data available to export for DXF."}), 400
 
-        string_io_buffer = io.StringIO()
-        doc.write(string_io_buffer)
-        string_io_buffer.seek(0)
-        dxf_string_data = string_io_buffer.read()
-        dxf_bytes_data = dxf_string_data.encode(doc.encoding) # Default 'cp1252' or 'utf-8' if set
-        dxf_binary_buffer_for_send_file = io.BytesIO(dxf_bytes_data)
+        # Encode straight into the response buffer (no intermediate str copy).
+        # output_encoding is UTF-8 for R2007+ drawings; 'dxfreplace' is the
+        # error handler ezdxf requires for anything the encoding can't hold.
+        dxf_binary_buffer_for_send_file = _new_export_spool()
+        dxf_text_stream = io.TextIOWrapper(
+            dxf_binary_buffer_for_send_file, encoding=doc.output_encoding,
+            errors='dxfreplace', newline=''
+        )
+        doc.write(dxf_text_stream)
+        dxf_text_stream.detach()  # Flushes; keeps the spool open for sending
 
     except ImportError: # ezdxf not installed
         current_app.logger.error("DXF Export Error: ezdxf library is not installed.")
@@ -1584,111 +2560,254 @@ def export_dxf_multi():
 
     filename_base = get_sanitized_filename_base(selected_display_name)
     download_filename = f'{filename_base}_epsg{target_crs_epsg_str}_multi_lot_survey.dxf'
-    return send_file(dxf_binary_buffer_for_send_file, download_name=download_filename, as_attachment=True, mimetype='application/dxf')
+    return _send_export_spool(dxf_binary_buffer_for_send_file, download_filename, 'application/dxf', compress=True)
 
 # --- GeoJSON Specific Lot Handler ---
+GEOJSON_STREAM_FEATURES_PER_CHUNK = 256  # Features serialized per response chunk
+# Coordinate precision written to GeoJSON (RFC 7946 section 11.2): 7 decimals of a
+# degree is ~1.1 cm at the equator, 3 decimals of a projected metre is 1 mm. Both are
+# finer than survey tolerances and keep the encoded output about half the size.
+GEOJSON_LONLAT_DECIMALS = 7
+GEOJSON_PROJECTED_DECIMALS = 3
+
+
+def _iter_geojson_feature_collection(features, pretty=False):
+    """
+    Serializes a GeoJSON FeatureCollection incrementally.
+
+    Yields the collection in compact JSON, a few hundred features per chunk,
+    so the full document is never held in memory as one string.
+
+    Args:
+        features (list): GeoJSON Feature dictionaries.
+        pretty (bool): Emit the whole document at once, indented by two
+                       spaces (for debugging; not streamed).
+
+    Yields:
+        bytes: Consecutive pieces of the FeatureCollection document.
+    """
+    if pretty:
+        yield orjson.dumps(
+            {"type": "FeatureCollection", "features": features},
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+        return
+    yield b'{"type":"FeatureCollection","features":['
+    for start in range(0, len(features), GEOJSON_STREAM_FEATURES_PER_CHUNK):
+        chunk = b",".join(
+            orjson.dumps(feature, option=orjson.OPT_SERIALIZE_NUMPY)
+            for feature in features[start:start + GEOJSON_STREAM_FEATURES_PER_CHUNK]
+        )
+        yield (b"," + chunk) if start else chunk
+    yield b"]}"
+
+
+def _iter_geojson_text_sequence(features):
+    """
+    Serializes GeoJSON Features as a GeoJSON Text Sequence (RFC 8142).
+
+    Each Feature is written as its own compact JSON text, prefixed with the
+    record separator (0x1E) and terminated by a line feed.
+
+    Args:
+        features (list): GeoJSON Feature dictionaries.
+
+    Yields:
+        bytes: Consecutive pieces of the sequence, a few hundred features each.
+    """
+    for start in range(0, len(features), GEOJSON_STREAM_FEATURES_PER_CHUNK):
+        yield b"".join(
+            b"\x1e" + orjson.dumps(feature, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+            for feature in features[start:start + GEOJSON_STREAM_FEATURES_PER_CHUNK]
+        )
+
+
+def _geojson_feature(geometry_type, coordinates, properties):
+    """Builds one GeoJSON Feature dictionary."""
+    return {
+        "type": "Feature",
+        "geometry": {"type": geometry_type, "coordinates": coordinates},
+        "properties": properties
+    }
+
+
 def _geojson_lot_handler(lot_id, lot_name, geometry_result, context):
     # current_app is now imported at module level
     if geometry_result["status"] != "success":
-        current_app.logger.error(f"GeoJSON: Cannot include Lot '{lot_name}' due to error: {geometry_result.get('message')}")
+        current_app.logger.error("GeoJSON: Cannot include Lot '%s' due to error: %s", lot_name, geometry_result.get('message'))
         return False
 
     features = context['features']
-    target_crs_epsg_str = context['target_crs_epsg_str']
+    crs_name = context['crs_name']
     lot_latlon_data = geometry_result["latlon"]
-    lot_proj_data = geometry_result["projected"] 
+    pob_latlng = lot_latlon_data.get("pob_latlng")
+    pob_en = geometry_result["projected"].get("pob_en")
+    tie_line_latlngs = lot_latlon_data.get("tie_line_latlngs")
+    parcel_ring_lonlats = geometry_result.get("parcel_ring_lonlats", np.empty((0, 2)))
     data_added = False
 
-    if lot_latlon_data.get("pob_latlng") and lot_proj_data.get("pob_en"):
-        pob_lat, pob_lon = lot_latlon_data["pob_latlng"]
-        pob_e, pob_n = lot_proj_data["pob_en"]
-        features.append({
-            "type": "Feature",
-            "geometry": {"type": "Point", "coordinates": [pob_lon, pob_lat]},
-            "properties": {
+    if pob_latlng and pob_en:
+        pob_lat, pob_lon = pob_latlng
+        pob_e, pob_n = pob_en
+        features.append(_geojson_feature(
+            "Point",
+            [round(pob_lon, GEOJSON_LONLAT_DECIMALS), round(pob_lat, GEOJSON_LONLAT_DECIMALS)],
+            {
                 "name": f"POB - {lot_name}", "lotName": lot_name, "type": "POB",
-                "easting": pob_e, "northing": pob_n, "crs": f"EPSG:{target_crs_epsg_str}"
+                "easting": round(pob_e, GEOJSON_PROJECTED_DECIMALS),
+                "northing": round(pob_n, GEOJSON_PROJECTED_DECIMALS), "crs": crs_name
             }
-        })
+        ))
         data_added = True
 
-    if lot_latlon_data.get("tie_line_latlngs") and len(lot_latlon_data["tie_line_latlngs"]) == 2:
-        tie_line_coords_lonlat = [[ll[1], ll[0]] for ll in lot_latlon_data["tie_line_latlngs"]]
-        features.append({
-            "type": "Feature",
-            "geometry": {"type": "LineString", "coordinates": tie_line_coords_lonlat},
-            "properties": {"name": f"Tie-Line - {lot_name}", "lotName": lot_name, "type": "TIE_LINE"}
-        })
+    if tie_line_latlngs and len(tie_line_latlngs) == 2:
+        tie_line_coords_lonlat = [
+            [round(ll[1], GEOJSON_LONLAT_DECIMALS), round(ll[0], GEOJSON_LONLAT_DECIMALS)]
+            for ll in tie_line_latlngs
+        ]
+        features.append(_geojson_feature("LineString", tie_line_coords_lonlat, {
+            "name": f"Tie-Line - {lot_name}", "lotName": lot_name, "type": "TIE_LINE"
+        }))
         data_added = True
 
-    parcel_latlng_list = lot_latlon_data.get("parcel_polygon_latlngs", [])
-    if parcel_latlng_list:
-        parcel_coords_lonlat = [[lon, lat] for lat, lon in parcel_latlng_list]
-        # Ensure at least 2 points for LineString, 4 for Polygon (3 unique + close)
-        geom_type = "Polygon" if len(parcel_coords_lonlat) >= 4 and parcel_coords_lonlat[0] == parcel_coords_lonlat[-1] else "LineString"
+    if len(parcel_ring_lonlats):
+        # Ensure at least 2 points for LineString, 4 for Polygon (3 unique + close).
+        # A closed ring repeats the first vertex exactly, as RFC 7946 requires.
+        is_closed_ring = len(parcel_ring_lonlats) >= 4 and geometry_result["parcel_ring_is_closed"]
+        # Left as an ndarray: orjson (OPT_SERIALIZE_NUMPY) encodes it without boxing each float.
+        parcel_coords_lonlat = np.round(parcel_ring_lonlats, GEOJSON_LONLAT_DECIMALS)
+        geom_type = "Polygon" if is_closed_ring else "LineString"
         
         if geom_type == "LineString" and len(parcel_coords_lonlat) < 2:
-            current_app.logger.warning(f"GeoJSON: Lot '{lot_name}' parcel has < 2 points, cannot form LineString. Skipping this geometry.")
+            current_app.logger.warning("GeoJSON: Lot '%s' parcel has < 2 points, cannot form LineString. Skipping this geometry.", lot_name)
         else:
-            geometry_data = {"type": geom_type, "coordinates": [parcel_coords_lonlat] if geom_type == "Polygon" else parcel_coords_lonlat}
-            features.append({
-                "type": "Feature",
-                "geometry": geometry_data,
-                "properties": {"name": f"Parcel - {lot_name}", "lotName": lot_name, "type": "PARCEL_BOUNDARY"}
-            })
+            features.append(_geojson_feature(
+                geom_type,
+                [parcel_coords_lonlat] if geom_type == "Polygon" else parcel_coords_lonlat,
+                {"name": f"Parcel - {lot_name}", "lotName": lot_name, "type": "PARCEL_BOUNDARY"}
+            ))
             data_added = True
     return data_added
 
-@app.route('/export_geojson_multi', methods=['POST'])
-@limiter.limit("5 per minute;20 per hour")
-def export_geojson_multi():
-    # current_app is now imported at module level
-    request_json_data = request.get_json()
-    if not request_json_data: return jsonify({"status": "error", "message": "No JSON data provided."}), 400
 
-    export_params, error_response_tuple = _prepare_export_data_for_routes(request_json_data, "GeoJSON")
-    if error_response_tuple: return error_response_tuple[1]
+def _build_geojson_features(export_params, export_format_name):
+    """
+    Builds the GeoJSON Features (reference monument plus every lot) for an
+    export from the prepared export parameters.
+
+    Args:
+        export_params (dict): Parameters from _prepare_export_data_cached().
+        export_format_name (str): Name of the export format, for logging.
 
+    Returns:
+        tuple: (features, has_data) where 'features' is the list of GeoJSON
+               Feature dictionaries and 'has_data' is False when neither the
+               reference point nor any lot produced exportable geometry.
+    """
     transformer_to_latlon = export_params["transformer_to_latlon"]
     main_ref_e = export_params["main_ref_e"]
     main_ref_n = export_params["main_ref_n"]
     main_ref_transformed_lonlat = export_params["main_ref_transformed_lonlat"]
     lots_data_from_payload = export_params["lots_data"]
     selected_display_name = export_params["selected_display_name"]
-    target_crs_epsg_str = export_params["target_crs_epsg_str"]
+    crs_name = f"EPSG:{export_params['target_crs_epsg_str']}"
 
     features = []
     has_main_ref_geojson_data = False
     if main_ref_transformed_lonlat and main_ref_e is not None:
         ref_lon, ref_lat = main_ref_transformed_lonlat
-        features.append({
-            "type": "Feature",
-            "geometry": {"type": "Point", "coordinates": [ref_lon, ref_lat]},
-            "properties": {
+        features.append(_geojson_feature(
+            "Point",
+            [round(ref_lon, GEOJSON_LONLAT_DECIMALS), round(ref_lat, GEOJSON_LONLAT_DECIMALS)],
+            {
                 "name": "Reference Monument", "displayName": selected_display_name,
-                "type": "REF_MONUMENT", "easting": main_ref_e, "northing": main_ref_n,
-                "crs": f"EPSG:{target_crs_epsg_str}"
+                "type": "REF_MONUMENT",
+                "easting": round(main_ref_e, GEOJSON_PROJECTED_DECIMALS),
+                "northing": round(main_ref_n, GEOJSON_PROJECTED_DECIMALS),
+                "crs": crs_name
             }
-        })
+        ))
         has_main_ref_geojson_data = True
     
-    geojson_processing_context = {'features': features, 'target_crs_epsg_str': target_crs_epsg_str}
+    geojson_processing_context = {'features': features, 'crs_name': crs_name}
     has_any_successful_geojson_lot_data = _process_lots_for_export(
         lots_data_from_payload, transformer_to_latlon, main_ref_e, main_ref_n,
-        _geojson_lot_handler, geojson_processing_context, "GeoJSON"
+        _geojson_lot_handler, geojson_processing_context, export_format_name
     )
-            
-    if not has_main_ref_geojson_data and not has_any_successful_geojson_lot_data:
+    return features, has_main_ref_geojson_data or has_any_successful_geojson_lot_data
+
+@app.route('/export_geojson_multi', methods=['POST'])
+@limiter.limit("5 per minute;20 per hour")
+def export_geojson_multi():
+    # current_app is now imported at module level
+    request_json_data = request.get_json()
+    if not request_json_data: return jsonify({"status": "error", "message": "No JSON data provided."}), 400
+
+    export_params, error_response_tuple = _prepare_export_data_cached(request_json_data, "GeoJSON")
+    if error_response_tuple: return error_response_tuple
+
+    features, has_data = _build_geojson_features(export_params, "GeoJSON")
+    if not has_data:
         return jsonify({"status": "error", "message": "No valid reference point or lot geometric data available to export for GeoJSON."}), 400
 
-    geojson_output = {"type": "FeatureCollection", "features": features}
-    geojson_str = json.dumps(geojson_output, indent=2)
-    geojson_buffer = io.BytesIO(geojson_str.encode('utf-8'))
+    filename_base = get_sanitized_filename_base(export_params["selected_display_name"])
+    download_filename = f'{filename_base}_epsg{export_params["target_crs_epsg_str"]}_multi_lot_survey.geojson'
     
-    filename_base = get_sanitized_filename_base(selected_display_name)
-    download_filename = f'{filename_base}_epsg{target_crs_epsg_str}_multi_lot_survey.geojson'
-    
-    return send_file(geojson_buffer, download_name=download_filename, as_attachment=True, mimetype='application/geo+json')
+    return _stream_export_download(
+        _iter_geojson_feature_collection(features, pretty=request.args.get('pretty') == '1'),
+        download_filename, 'application/geo+json', compress=True
+    )
+
+
+@app.route('/export_geojsonseq_multi', methods=['POST'])
+@limiter.limit("5 per minute;20 per hour")
+def export_geojsonseq_multi():
+    """
+    Exports the same Features as /export_geojson_multi as a GeoJSON Text
+    Sequence (RFC 8142), which clients such as QGIS and ogr2ogr can read
+    one Feature at a time.
+    """
+    request_json_data = request.get_json()
+    if not request_json_data: return jsonify({"status": "error", "message": "No JSON data provided."}), 400
+
+    export_params, error_response_tuple = _prepare_export_data_cached(request_json_data, "GeoJSONSeq")
+    if error_response_tuple: return error_response_tuple
+
+    features, has_data = _build_geojson_features(export_params, "GeoJSONSeq")
+    if not has_data:
+        return jsonify({"status": "error", "message": "No valid reference point or lot geometric data available to export for GeoJSON."}), 400
+
+    filename_base = get_sanitized_filename_base(export_params["selected_display_name"])
+    download_filename = f'{filename_base}_epsg{export_params["target_crs_epsg_str"]}_multi_lot_survey.geojsons'
+
+    return _stream_export_download(
+        _iter_geojson_text_sequence(features), download_filename, 'application/geo+json-seq',
+        compress=True
+    )
+
+
+# --- Worker Warm-up ---
+
+# Target CRSs offered in the UI (PRS92 Philippines zones I-V).
+PRELOAD_TARGET_CRS_EPSGS = (25391, 25392, 25393, 25394, 25395)
+
+
+def warm_up_worker():
+    """
+    Builds the transformers for the UI's target CRSs and loads the reference
+    points, so a worker's first requests do not pay for PROJ initialization
+    or CSV parsing.
+
+    Called from gunicorn's post_fork hook (see gunicorn.conf.py), in each
+    worker after it has been forked; nothing here runs at import. PROJ
+    contexts are not fork-safe, so they must never be created in the master
+    process and inherited by the workers.
+    """
+    with app.app_context():
+        for epsg in PRELOAD_TARGET_CRS_EPSGS:
+            get_transformers(str(epsg))
+        load_reference_points()
+
 
 if __name__ == '__main__':
     app.run()
\ No newline at end of file
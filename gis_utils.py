@@ -1,86 +1,201 @@
-"""
-GIS utility functions, primarily for managing Coordinate Reference System (CRS)
-transformations.
-"""
-
-# Third-party imports
-from flask import current_app
-from pyproj import CRS, Transformer
-from pyproj.exceptions import CRSError
-
-
-DEFAULT_TARGET_CRS_EPSG = 25393  # Default projected CRS for the application
-CRS_LATLON_EPSG = 4326  # Standard WGS84 Lat/Lon CRS
-
-_transformer_cache = {}  # Cache for storing pyproj Transformer objects
-
-
-def get_transformers(target_crs_epsg_str):
-    """
-    Retrieves or creates and caches pyproj Transformer objects for converting
-    between the target projected CRS and WGS84 Lat/Lon (EPSG:4326).
-
-    Args:
-        target_crs_epsg_str (str): The EPSG code of the target projected CRS
-                                   as a string.
-
-    Returns:
-        tuple: (transformer_to_latlon, transformer_to_projected, error_message)
-               Returns two Transformer objects and None for error_message on success.
-               On failure, returns (None, None, user_friendly_error_message).
-    """
-    try:
-        target_crs_epsg = int(target_crs_epsg_str)
-    except ValueError:
-        user_msg = (
-            f"The Target CRS EPSG code must be a whole number (e.g., 25393), "
-            f"but received: '{target_crs_epsg_str}'."
-        )
-        current_app.logger.error(
-            f"ValueError in get_transformers: Invalid Target CRS EPSG "
-            f"'{target_crs_epsg_str}' - not an integer."
-        )
-        return None, None, user_msg
-
-    if target_crs_epsg in _transformer_cache:
-        current_app.logger.debug(f"Using cached transformer for EPSG:{target_crs_epsg}")
-        cached_to_latlon, cached_to_projected = _transformer_cache[target_crs_epsg]
-        return cached_to_latlon, cached_to_projected, None
-
-    try:
-        crs_projected = CRS.from_epsg(target_crs_epsg)
-        crs_latlon = CRS.from_epsg(CRS_LATLON_EPSG)
-        
-        transformer_to_latlon = Transformer.from_crs(
-            crs_projected, crs_latlon, always_xy=True
-        )
-        transformer_to_projected = Transformer.from_crs(
-            crs_latlon, crs_projected, always_xy=True
-        )
-        
-        _transformer_cache[target_crs_epsg] = (transformer_to_latlon, transformer_to_projected)
-        current_app.logger.info(
-            f"Created and cached new transformer for EPSG:{target_crs_epsg}"
-        )
-        return transformer_to_latlon, transformer_to_projected, None
-    except CRSError as e:
-        user_msg = (
-            f"The Target CRS EPSG code '{target_crs_epsg_str}' is invalid or "
-            f"not supported. Please check the code or contact support if the "
-            f"issue persists."
-        )
-        current_app.logger.error(
-            f"CRSError in get_transformers for EPSG '{target_crs_epsg_str}': {str(e)}"
-        )
-        return None, None, user_msg
-    except Exception as e:
-        user_msg = (
-            f"A server error occurred while initializing the Coordinate Reference "
-            f"System for EPSG code '{target_crs_epsg_str}'. Please try again "
-            f"later or contact support."
-        )
-        current_app.logger.error(
-            f"Exception in get_transformers for EPSG '{target_crs_epsg_str}': {str(e)}",
-            exc_info=True
-        )
-        return None, None, user_msg
+"""
+GIS utility functions, primarily for managing Coordinate Reference System (CRS)
+transformations.
+"""
+
+# Standard library imports
+import os
+import threading
+from collections import OrderedDict
+
+# Third-party imports
+from flask import current_app
+from pyproj import CRS, Transformer
+from pyproj.exceptions import CRSError
+from pyproj.network import set_network_enabled
+
+# Keep PROJ off the network so a request is never stalled by a remote grid
+# download, unless the deployment has chosen otherwise through PROJ_NETWORK.
+if os.environ.get("PROJ_NETWORK") is None:
+    set_network_enabled(False)
+
+
+DEFAULT_TARGET_CRS_EPSG = 25393  # Default projected CRS for the application
+CRS_LATLON_EPSG = 4326  # Standard WGS84 Lat/Lon CRS
+
+# LRU cache of Transformer objects keyed by (EPSG code, to_latlon). Building a
+# PROJ pipeline costs milliseconds to seconds while a cached one is reused for
+# free; each direction is built only when first asked for. The bound leaves
+# room for both directions of every zone of a multi-zone (e.g. all-UTM)
+# workload without letting arbitrary EPSG codes grow it forever.
+TRANSFORMER_CACHE_MAX_ENTRIES = 300
+_transformer_cache = OrderedDict()
+_transformer_cache_lock = threading.Lock()
+
+
+class IdentityTransformer:
+    """
+    Stand-in for a pyproj Transformer between two equal CRSs.
+
+    Returned by the transformer getters when the target CRS already is WGS84, so
+    callers can skip the PROJ call entirely. transform() hands back its
+    inputs as-is (no copy is made for NumPy arrays).
+    """
+
+    def transform(self, xx, yy):
+        return xx, yy
+
+
+def clear_transformer_cache():
+    """
+    Drops every cached Transformer, so the next lookups build new ones.
+
+    Used after a process fork: PROJ contexts are not fork-safe, so a worker
+    must not reuse Transformers created in its parent process.
+    """
+    with _transformer_cache_lock:
+        _transformer_cache.clear()
+
+
+def get_transformer_to_latlon(target_crs_epsg_str):
+    """
+    Retrieves or creates and caches the pyproj Transformer from the target
+    projected CRS to WGS84 Lat/Lon (EPSG:4326).
+
+    Args:
+        target_crs_epsg_str (str): The EPSG code of the target projected CRS
+                                   as a string.
+
+    Returns:
+        tuple: (transformer_to_latlon, error_message). On success the error
+               message is None (the transformer is an IdentityTransformer if
+               the target CRS is WGS84 itself); on failure the result is
+               (None, user_friendly_error_message).
+    """
+    return _get_transformer(target_crs_epsg_str, to_latlon=True)
+
+
+def get_transformer_to_projected(target_crs_epsg_str):
+    """
+    Retrieves or creates and caches the pyproj Transformer from WGS84 Lat/Lon
+    (EPSG:4326) to the target projected CRS.
+
+    Args:
+        target_crs_epsg_str (str): The EPSG code of the target projected CRS
+                                   as a string.
+
+    Returns:
+        tuple: (transformer_to_projected, error_message), as for
+               get_transformer_to_latlon().
+    """
+    return _get_transformer(target_crs_epsg_str, to_latlon=False)
+
+
+def get_transformers(target_crs_epsg_str):
+    """
+    Retrieves both transformers between the target projected CRS and WGS84
+    Lat/Lon (EPSG:4326). Callers that need only one direction should use
+    get_transformer_to_latlon() or get_transformer_to_projected().
+
+    Args:
+        target_crs_epsg_str (str): The EPSG code of the target projected CRS
+                                   as a string.
+
+    Returns:
+        tuple: (transformer_to_latlon, transformer_to_projected, error_message)
+               Returns two Transformer objects and None for error_message on success
+               (IdentityTransformer objects if the target CRS is WGS84 itself).
+               On failure, returns (None, None, user_friendly_error_message).
+    """
+    transformer_to_latlon, error_message = get_transformer_to_latlon(target_crs_epsg_str)
+    if error_message:
+        return None, None, error_message
+    transformer_to_projected, error_message = get_transformer_to_projected(target_crs_epsg_str)
+    if error_message:
+        return None, None, error_message
+    return transformer_to_latlon, transformer_to_projected, None
+
+
+def _get_transformer(target_crs_epsg_str, to_latlon):
+    """
+    Shared implementation of get_transformer_to_latlon() and
+    get_transformer_to_projected().
+
+    Args:
+        target_crs_epsg_str (str): The EPSG code of the target projected CRS
+                                   as a string.
+        to_latlon (bool): True for projected -> Lat/Lon, False for the reverse.
+
+    Returns:
+        tuple: (transformer, error_message) as described by the callers.
+    """
+    try:
+        target_crs_epsg = int(target_crs_epsg_str)
+    except ValueError:
+        user_msg = (
+            f"The Target CRS EPSG code must be a whole number (e.g., 25393), "
+            f"but received: '{target_crs_epsg_str}'."
+        )
+        current_app.logger.error(
+            f"ValueError in get_transformers: Invalid Target CRS EPSG "
+            f"'{target_crs_epsg_str}' - not an integer."
+        )
+        return None, user_msg
+
+    cache_key = (target_crs_epsg, to_latlon)
+    with _transformer_cache_lock:
+        cached_transformer = _transformer_cache.get(cache_key)
+        if cached_transformer is not None:
+            _transformer_cache.move_to_end(cache_key)
+    if cached_transformer is not None:
+        # Hit path runs on every request: no logging (an f-string is
+        # formatted even when DEBUG is off).
+        return cached_transformer, None
+
+    direction = "to Lat/Lon" if to_latlon else "to projected"
+    try:
+        if target_crs_epsg == CRS_LATLON_EPSG:
+            # No-op transformation; known without a PROJ database lookup
+            transformer = IdentityTransformer()
+        else:
+            crs_projected = CRS.from_epsg(target_crs_epsg)
+            crs_latlon = CRS.from_epsg(CRS_LATLON_EPSG)
+
+            if crs_projected.equals(crs_latlon):
+                # No-op transformation: avoid PROJ overhead on every call
+                transformer = IdentityTransformer()
+            elif to_latlon:
+                transformer = Transformer.from_crs(crs_projected, crs_latlon, always_xy=True)
+            else:
+                transformer = Transformer.from_crs(crs_latlon, crs_projected, always_xy=True)
+        
+        with _transformer_cache_lock:
+            _transformer_cache[cache_key] = transformer
+            _transformer_cache.move_to_end(cache_key)
+            while len(_transformer_cache) > TRANSFORMER_CACHE_MAX_ENTRIES:
+                _transformer_cache.popitem(last=False)
+        current_app.logger.info(
+            f"Created and cached new transformer {direction} for EPSG:{target_crs_epsg}"
+        )
+        return transformer, None
+    except CRSError as e:
+        user_msg = (
+            f"The Target CRS EPSG code '{target_crs_epsg_str}' is invalid or "
+            f"not supported. Please check the code or contact support if the "
+            f"issue persists."
+        )
+        current_app.logger.error(
+            f"CRSError in get_transformers for EPSG '{target_crs_epsg_str}': {str(e)}"
+        )
+        return None, user_msg
+    except Exception as e:
+        user_msg = (
+            f"A server error occurred while initializing the Coordinate Reference "
+            f"System for EPSG code '{target_crs_epsg_str}'. Please try again "
+            f"later or contact support."
+        )
+        current_app.logger.error(
+            f"Exception in get_transformers for EPSG '{target_crs_epsg_str}': {str(e)}",
+            exc_info=True
+        )
+        return None, user_msg
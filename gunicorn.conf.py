@@ -0,0 +1,35 @@
+"""
+Gunicorn settings for serving the application in production.
+
+Gunicorn reads this file automatically when started from the project root:
+
+    gunicorn app:app
+
+Command-line options (e.g. -w, -b) still override the values below.
+"""
+
+# Standard library imports
+import os
+
+# Import app.py once in the master process and fork the workers from it, so
+# the Python modules (Flask, pandas, pyproj, ...) are loaded a single time and
+# shared copy-on-write. Importing the app creates no PROJ objects; each worker
+# builds its own in post_fork below, as PROJ contexts are not fork-safe.
+preload_app = True
+
+# Worker processes; WEB_CONCURRENCY is the conventional override on PaaS hosts.
+# Rate limits are counted per worker unless RATELIMIT_STORAGE_URI points the
+# limiter at a shared store (see app.py).
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+
+# Bind to $PORT when the host provides one.
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+
+def post_fork(server, worker):
+    """Warms each worker's own transformers and reference points after the fork."""
+    import app  # Already imported when preload_app is on
+    import gis_utils
+    # Never reuse Transformers inherited from the master, should any exist
+    gis_utils.clear_transformer_cache()
+    app.warm_up_worker()
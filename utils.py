@@ -4,14 +4,29 @@ Utility functions for survey calculations and string manipulation.
 """
 
 # Standard library imports
+import functools
 import math
 import re
 
 # Third-party imports
 from flask import current_app
 
-# Pre-compiled regular expression for parsing survey bearing lines
-BEARING_REGEX = re.compile(r'([NS])\s+(\d{1,2})[Dd]\s+(\d{1,2})[′\'’]\s+([EW])', re.IGNORECASE)
+# Pre-compiled regular expression for parsing survey bearing lines; matched
+# against the upper-cased bearing, so it needs no IGNORECASE folding
+BEARING_REGEX = re.compile(r'([NS])\s+(\d{1,2})D\s+(\d{1,2})[′\'’]\s+([EW])')
+# Pre-compiled regular expression for characters not allowed in export filenames
+FILENAME_UNSAFE_CHARS_REGEX = re.compile(r'[^\w-]')
+# Bearing text: (ns_char, degrees, minutes, seconds, ew_char), e.g. "N 45D00′00″ E"
+BEARING_STRING_FORMAT = "%s %02dD%02d′%02d″ %s"
+# (sign, offset) per bearing quadrant: azimuth = offset + sign * decimal degrees
+AZIMUTH_QUADRANTS = {
+    ('N', 'E'): (1.0, 0.0),
+    ('S', 'E'): (-1.0, 180.0),
+    ('S', 'W'): (1.0, 180.0),
+    ('N', 'W'): (-1.0, 360.0),
+}
+# Bearing quadrants in azimuth order: 0-90, 90-180, 180-270 and 270-360 degrees
+AZIMUTH_QUADRANT_ORDER = (('N', 'E'), ('S', 'E'), ('S', 'W'), ('N', 'W'))
 
 def parse_survey_line_to_bearing_distance(line_str):
     """
@@ -44,7 +59,7 @@ def parse_survey_line_to_bearing_distance(line_str):
         return None
 
     # Regex for bearing: e.g., N 01D 02′ E or S89D59'W
-    match = BEARING_REGEX.match(parts[0].strip())
+    match = BEARING_REGEX.match(parts[0].strip().upper())
     if not match:
         current_app.logger.warning(f"Invalid bearing format: {parts[0]} in {line_str}")
         return None
@@ -60,10 +75,10 @@ def parse_survey_line_to_bearing_distance(line_str):
         return None
 
     return {
-        'ns': ns.upper(),
+        'ns': ns,
         'deg': deg,
         'min': min_val,
-        'ew': ew.upper(),
+        'ew': ew,
         'distance': distance
     }
 
@@ -80,36 +95,27 @@ def calculate_azimuth(bearing_info):
         float or None: The calculated azimuth in decimal degrees, or None
                        if the bearing information is invalid.
     """
-    # Validate structure of bearing_info
-    required_keys = ['ns', 'ew', 'deg', 'min']
-    if not all(key in bearing_info for key in required_keys):
+    # Validate structure of bearing_info while reading it (one probe per key)
+    try:
+        ns = bearing_info['ns']
+        ew = bearing_info['ew']
+        dec_deg = bearing_info['deg'] + (bearing_info['min'] / 60.0)
+    except KeyError:
         current_app.logger.error(
             f"Invalid bearing_info structure (missing keys): {bearing_info}"
         )
         return None
 
-    dec_deg = bearing_info['deg'] + (bearing_info['min'] / 60.0)
-    ns = bearing_info['ns']
-    ew = bearing_info['ew']
-
-    # Validate ns and ew values
-    if ns not in ['N', 'S'] or ew not in ['E', 'W']:
+    # Validate ns and ew values while looking up the quadrant
+    quadrant = AZIMUTH_QUADRANTS.get((ns, ew))
+    if quadrant is None:
         current_app.logger.error(
             f"Invalid NS ('{ns}') or EW ('{ew}') values in bearing_info: {bearing_info}"
         )
         return None
 
-    if ns == 'N' and ew == 'E':
-        return dec_deg
-    if ns == 'S' and ew == 'E':
-        return 180.0 - dec_deg
-    if ns == 'S' and ew == 'W':
-        return 180.0 + dec_deg
-    if ns == 'N' and ew == 'W':
-        return 360.0 - dec_deg
-    
-    current_app.logger.error(f"Cannot determine azimuth from bearing: {bearing_info}")
-    return None
+    sign, offset = quadrant
+    return offset + sign * dec_deg
 
 
 def calculate_new_coordinates(e_start, n_start, azimuth_deg, distance):
@@ -131,14 +137,18 @@ def calculate_new_coordinates(e_start, n_start, azimuth_deg, distance):
 
 def get_sanitized_filename_base(selected_display_name):
     if not selected_display_name: return "survey_export"
-    base = re.sub(r'[^\w-]', '', selected_display_name.split(' - ')[0]).strip()[:30]
+    base = FILENAME_UNSAFE_CHARS_REGEX.sub('', selected_display_name.split(' - ')[0]).strip()[:30]
     return base if base else "export"
 
 
+@functools.lru_cache(maxsize=4096)
 def decimal_azimuth_to_bearing_string(azimuth_deg):
     """
     Converts a decimal degree azimuth (0-360) into a formatted bearing string.
 
+    The result is memoized: a lot resubmitted unchanged yields the identical
+    misclosure azimuth, so its bearing text is only formatted once.
+
     Args:
         azimuth_deg (float): Azimuth in decimal degrees.
 
@@ -160,45 +170,21 @@ def decimal_azimuth_to_bearing_string(azimuth_deg):
     if abs(azimuth_deg - 270.0) < epsilon:
         return "Due West"
 
-    bearing_angle = 0.0
-    ns_char = ''
-    ew_char = ''
-
-    if 0.0 < azimuth_deg < 90.0:
-        bearing_angle = azimuth_deg
-        ns_char = 'N'
-        ew_char = 'E'
-    elif 90.0 < azimuth_deg < 180.0:
-        bearing_angle = 180.0 - azimuth_deg
-        ns_char = 'S'
-        ew_char = 'E'
-    elif 180.0 < azimuth_deg < 270.0:
-        bearing_angle = azimuth_deg - 180.0
-        ns_char = 'S'
-        ew_char = 'W'
-    elif 270.0 < azimuth_deg < 360.0:
-        bearing_angle = 360.0 - azimuth_deg
-        ns_char = 'N'
-        ew_char = 'W'
-    else:
+    if not 0.0 < azimuth_deg < 360.0:
         # Should ideally not be reached if input is 0-360 and cardinal checks are done
         return "Invalid Azimuth"
 
-    degrees = int(bearing_angle)
-    minutes_float = (bearing_angle - degrees) * 60.0
-    minutes = int(minutes_float)
-    seconds_float = (minutes_float - minutes) * 60.0
-    seconds = int(round(seconds_float))
-
-    if seconds == 60:
-        seconds = 0
-        minutes += 1
-    if minutes == 60:
-        minutes = 0
-        degrees += 1
+    # Quadrant from the azimuth, then the inverse of calculate_azimuth()
+    ns_char, ew_char = AZIMUTH_QUADRANT_ORDER[int(azimuth_deg // 90.0)]
+    sign, offset = AZIMUTH_QUADRANTS[(ns_char, ew_char)]
+    bearing_angle = sign * (azimuth_deg - offset)
+
+    # Rounded once to whole arcseconds, so seconds and minutes cannot reach 60
+    degrees, remaining_seconds = divmod(int(round(bearing_angle * 3600.0)), 3600)
+    minutes, seconds = divmod(remaining_seconds, 60)
     
     # Bearing angles should be < 90, so degrees should not exceed 89 here.
     # If degrees became 90, it implies the original azimuth was a cardinal direction,
     # which should have been caught by the initial checks.
 
-    return f"{ns_char} {degrees:02d}D{minutes:02d}′{seconds:02d}″ {ew_char}"
\ No newline at end of file
+    return BEARING_STRING_FORMAT % (ns_char, degrees, minutes, seconds, ew_char)
\ No newline at end of file